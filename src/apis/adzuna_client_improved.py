@@ -174,7 +174,7 @@ class AdzunaClientImproved(BaseAPIClient):
         # Si no hay países específicos, usar una selección inteligente
         # Verificar si las keywords indican búsqueda de trabajo tech/remoto
         config = config_loader.get_config()
-        keywords = (config.get('job_titles', []) or []) + (config.get('tools_technologies', []) or [])
+        keywords = [*(config.get('job_titles') or ()), *(config.get('tools_technologies') or ())]
         
         tech_terms = ['developer', 'software', 'data', 'engineer', 'remote', 'python', 'javascript']
         is_tech_search = any(term.lower() in ' '.join(keywords).lower() for term in tech_terms)
@@ -9,8 +9,16 @@ nos interesan realmente, basándonos en los criterios definidos en
 settings.yaml (keywords y ubicaciones).
 """
 
+import functools
+import itertools
+import json
 import logging
-from typing import List, Dict, Any, Set
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Set, Callable, Iterable, Iterator, Mapping, Optional, Tuple, Union
 
 try:
     from src.utils import config_loader
@@ -19,8 +27,245 @@ except ImportError:
     logging.warning("No se pudo importar config_loader en job_filter. Usando criterios vacíos.")
     config_loader = None
 
+# pyahocorasick es opcional: con él buscamos TODAS las keywords en una sola pasada
+# por el texto (autómata Aho-Corasick) en vez de un 'kw in text' por keyword.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Hyperscan (opcional, solo x86) es aún más rápido: compila todas las keywords en un único
+# autómata con SIMD. Si está instalado, tiene prioridad sobre pyahocorasick.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# numpy (opcional) para filter_jobs_soa, el filtro sobre columnas
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Decodificación rápida de ofertas en JSON (opcionales, ver decode_jobs)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Si la oferta incluye términos relacionados con programación/tecnología,
+# aunque no coincida exactamente con nuestras keywords, la consideramos
+TECH_INDICATORS = ('programador', 'developer', 'ingeniero', 'engineer', 'código', 'code',
+                   'software', 'desarrollo', 'development', 'tech', 'tecnología', 'technology',
+                   'computer', 'computación', 'informática', 'it ', ' it,', 'database', 'datos',
+                   'data', 'web', 'app', 'aplicación', 'application')
+
+# Términos que delatan una oferta remota (solo cuentan si buscamos remoto)
+REMOTE_TERMS = ('remote', 'remoto', 'teletrabajo', 'trabajo a distancia', 'home office',
+                'trabajo desde casa')
+
+# A partir de cuántas ofertas compensa montar un DataFrame en filter_jobs
+# (solo cuando no hay Hyperscan ni pyahocorasick, ver JobFilter._filter_batch)
+PANDAS_MIN_JOBS = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pandas():
+    """Importa pandas la primera vez que hace falta (tarda bastante en cargar). None si no está."""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
+
+def _alternation(needles: Iterable[str]) -> str:
+    """Une las subcadenas en una sola regex 'a|b|c', escapando lo que haga falta."""
+    return "|".join(re.escape(needle) for needle in needles)
+
+
+# Con msgspec decodificamos a dicts normales (sin esquema: no se pierde ningún
+# campo ni se valida el tipo del id), solo que en C y más rápido que json.
+_jobs_decoder = msgspec.json.Decoder(List[Dict[str, Any]]) if msgspec is not None else None
+
+
+def decode_jobs(buf: Union[bytes, str]) -> List[Dict[str, Any]]:
+    """
+    Decodifica una lista JSON de ofertas para pasarla a JobFilter.filter_jobs.
+
+    Siempre devuelve una lista de dicts con todos los campos del JSON, sea cual sea
+    el decodificador disponible: msgspec, orjson o el json de siempre (en ese orden).
+    """
+    if _jobs_decoder is not None:
+        return _jobs_decoder.decode(buf)
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _job_field(job: Any, key: str, default: Any = "") -> Any:
+    """Lee un campo de la oferta, sea un dict o un objeto con atributos."""
+    if isinstance(job, dict):
+        return job.get(key, default)
+    return getattr(job, key, default)
+
+
+# Claves donde normalize_for_filter deja el texto ya preparado dentro de cada oferta
+FILTER_TEXT_KEY = '_h'
+FILTER_LOCATION_KEY = '_loc'
+
+
+def _job_haystack(job: Any) -> str:
+    """Texto de la oferta donde buscamos keywords: título + descripción + empresa, en minúsculas."""
+    # str() para que None/números no rompan nada; un solo lower() para las tres partes
+    if isinstance(job, dict):
+        cached = job.get(FILTER_TEXT_KEY)
+        if cached is not None:
+            return cached
+        return f"{job.get('titulo', '')} {job.get('descripcion', '')} {job.get('empresa', '')}".lower()
+    return f"{_job_field(job, 'titulo')} {_job_field(job, 'descripcion')} {_job_field(job, 'empresa')}".lower()
+
+
+def _job_location(job: Any) -> str:
+    """Ubicación de la oferta normalizada para compararla con las nuestras."""
+    if isinstance(job, dict):
+        cached = job.get(FILTER_LOCATION_KEY)
+        if cached is not None:
+            return cached
+    return str(_job_field(job, 'ubicacion')).lower().strip()
+
+
+def normalize_for_filter(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deja dentro de la oferta (un dict) su texto y su ubicación ya en minúsculas, en las
+    claves '_h' y '_loc', para que JobFilter no tenga que volver a armarlos. Compensa
+    cuando las mismas ofertas pasan por varios filtros (p. ej. distintas configuraciones).
+
+    OJO: si después se modifican titulo/descripcion/empresa/ubicacion, hay que volver
+    a llamarla. Modifica la oferta y la devuelve, por comodidad.
+    """
+    job.pop(FILTER_TEXT_KEY, None)
+    job.pop(FILTER_LOCATION_KEY, None)
+    job[FILTER_TEXT_KEY] = _job_haystack(job)
+    job[FILTER_LOCATION_KEY] = _job_location(job)
+    return job
+
+
+def _build_hyperscan_matcher(needles: List[str]) -> Callable[[str], Optional[str]]:
+    """Versión de _build_matcher con una base de datos de Hyperscan (trabaja sobre bytes UTF-8)."""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(needle).encode('utf-8') for needle in needles],
+        ids=list(range(len(needles))),
+        elements=len(needles),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(needles),
+    )
+    # El 'scratch' es la memoria de trabajo del escaneo y no se puede usar desde
+    # dos hilos a la vez: cada hilo se hace su copia (clone) la primera vez.
+    base_scratch = hyperscan.Scratch(database)
+    local = threading.local()
+
+    def on_match(needle_id, _start, _end, _flags, found):
+        found.append(needle_id)
+        return True # Con la primera coincidencia nos basta: detener el escaneo
+
+    def search(text: str) -> Optional[str]:
+        scratch = getattr(local, 'scratch', None)
+        if scratch is None:
+            scratch = local.scratch = base_scratch.clone()
+        found: List[int] = [] # Propia de esta llamada, nada compartido entre hilos
+        try:
+            database.scan(text.encode('utf-8'), match_event_handler=on_match,
+                          context=found, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass # Lo lanza cuando on_match pide detenerse
+        return needles[found[0]] if found else None
+    return search
+
+
+def _build_matcher(needles: Iterable[str]) -> Callable[[str], Optional[str]]:
+    """
+    Prepara la búsqueda de varias subcadenas a la vez.
+
+    Devuelve una función que recibe un texto (ya en minúsculas) y devuelve la
+    primera de 'needles' que aparezca en él, o None si no aparece ninguna.
+    Con Hyperscan o pyahocorasick se recorre el texto una sola vez sin importar
+    cuántas subcadenas haya; sin ellos, se usa una única regex con todas las alternativas.
+    """
+    needles = list(dict.fromkeys(needles)) # Sin duplicados, manteniendo el orden
+    if not needles:
+        return lambda text: None
+    if "" in needles:
+        return lambda text: "" # La cadena vacía está en cualquier texto
+
+    if hyperscan is not None:
+        try:
+            return _build_hyperscan_matcher(needles)
+        except hyperscan.HyperscanError:
+            logger.warning("No se pudo compilar la base de Hyperscan, usando la alternativa", exc_info=True)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+
+        def search(text: str) -> Optional[str]:
+            for _end_index, needle in automaton.iter(text):
+                return needle
+            return None
+        return search
+
+    # Sin pyahocorasick: una sola alternancia precompilada. El recorrido del texto
+    # ocurre dentro del motor de 're' (en C) en lugar de un bucle Python por keyword.
+    pattern = re.compile(_alternation(needles), re.IGNORECASE)
+
+    def search(text: str) -> Optional[str]:
+        match = pattern.search(text)
+        return match.group(0) if match else None
+    return search
+
+
+# Claves de los criterios ya preparados que devuelve compile_filter_criteria
+COMPILED_KEYWORDS_KEY = 'keywords_lc'
+COMPILED_LOCATIONS_KEY = 'locations_lc'
+COMPILED_REMOTE_KEY = 'target_remote'
+
+
+def compile_filter_criteria(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prepara una sola vez los criterios de filtrado a partir de la configuración:
+    keywords (títulos + herramientas + temas) y ubicaciones en minúsculas, y si
+    buscamos remoto. JobFilter() la aplica a la config, y from_criteria recibe
+    su salida ya hecha (así los procesos de filter_jobs_parallel no la repiten).
+    """
+    titles = config.get('job_titles') or ()
+    tools = config.get('tools_technologies') or ()
+    topics = config.get('topics') or ()
+    # chain y no '+': así da igual si vienen como tuplas (get_config()) o como listas
+    all_keywords = itertools.chain(titles, tools, topics)
+
+    # Internadas: son pocas, viven todo el proceso y se comparan contra cada oferta
+    keywords = frozenset(sys.intern(kw.lower()) for kw in all_keywords if isinstance(kw, str))
+    locations = frozenset(sys.intern(loc.lower()) for loc in config.get('locations') or () if isinstance(loc, str))
+    return {
+        COMPILED_KEYWORDS_KEY: keywords,
+        COMPILED_LOCATIONS_KEY: locations,
+        COMPILED_REMOTE_KEY: any('remote' in loc or 'remoto' in loc for loc in locations),
+    }
+
+
+# A partir de cuántas ofertas compensa arrancar procesos en filter_jobs_parallel
+PARALLEL_MIN_JOBS = 5000
+
+
 class JobFilter:
     def __init__(self):
         logger.info("Inicializando JobFilter...")
@@ -31,18 +276,14 @@ class JobFilter:
         try:
             if config_loader:
                 config = config_loader.get_config() or {}
-                if not isinstance(config, dict):
+                if not isinstance(config, Mapping):
                     logger.error("No se pudo cargar la configuración para JobFilter. El filtro usará criterios vacíos.")
                     return
 
-                titles = config.get('job_titles', [])
-                tools = config.get('tools_technologies', [])
-                topics = config.get('topics', [])
-                all_keywords = titles + tools + topics
-
-                self.keywords = {kw.lower() for kw in all_keywords if isinstance(kw, str)}
-                self.target_locations = {loc.lower() for loc in config.get('locations', []) if isinstance(loc, str)}
-                self.target_remote = any('remote' in loc or 'remoto' in loc for loc in self.target_locations)
+                criteria = compile_filter_criteria(config)
+                self.keywords = set(criteria[COMPILED_KEYWORDS_KEY])
+                self.target_locations = set(criteria[COMPILED_LOCATIONS_KEY])
+                self.target_remote = bool(criteria[COMPILED_REMOTE_KEY])
             else:
                 logger.error("config_loader no está disponible. JobFilter usará criterios vacíos.")
         except Exception as e:
@@ -50,109 +291,150 @@ class JobFilter:
             self.keywords = set()
             self.target_locations = set()
             self.target_remote = False
+        finally:
+            self._build_matchers()
+
+    @classmethod
+    def from_criteria(cls, criteria: Dict[str, Any]) -> "JobFilter":
+        """
+        Crea un JobFilter directamente con criterios ya preparados (la salida de
+        compile_filter_criteria), sin pasar por config_loader. Lo usan, p. ej., los
+        procesos de filter_jobs_parallel.
+        """
+        job_filter = cls.__new__(cls)
+        job_filter.keywords = set(criteria[COMPILED_KEYWORDS_KEY])
+        job_filter.target_locations = set(criteria[COMPILED_LOCATIONS_KEY])
+        job_filter.target_remote = bool(criteria[COMPILED_REMOTE_KEY])
+        job_filter._build_matchers()
+        return job_filter
 
-    def _matches_keywords(self, job: Dict[str, Any]) -> bool:
+    def _criteria(self) -> Dict[str, Any]:
+        """Los criterios actuales en el formato de compile_filter_criteria."""
+        return {
+            COMPILED_KEYWORDS_KEY: frozenset(self.keywords),
+            COMPILED_LOCATIONS_KEY: frozenset(self.target_locations),
+            COMPILED_REMOTE_KEY: self.target_remote,
+        }
+
+    def _build_matchers(self) -> None:
+        """Prepara los buscadores una sola vez aquí, no en cada oferta."""
+        self._find_keyword = _build_matcher(sorted(self.keywords))
+        self._find_tech_indicator = _build_matcher(TECH_INDICATORS)
+        # Ubicaciones: primero la búsqueda exacta (un hash), luego por subcadena
+        self._exact_locations = frozenset(self.target_locations)
+        self._find_location = _build_matcher(sorted(self.target_locations))
+        self._find_remote_term = _build_matcher(REMOTE_TERMS)
+        # Sin Hyperscan ni pyahocorasick los buscadores son regex: solo entonces
+        # compensa el camino de pandas para listas grandes.
+        self._regex_only = hyperscan is None and ahocorasick is None
+
+    def _matches_keywords(self, job: Dict[str, Any], text: Optional[str] = None) -> bool:
         """
         Verifica si una oferta contiene al menos UNA de las palabras clave de interés.
         Si no hay keywords configuradas, todas las ofertas pasan este filtro.
+        'text' es el texto ya preparado con _job_haystack (si no se pasa, se calcula).
         """
         if not self.keywords:
             return True
 
-        # Obtener campos relevantes donde buscar keywords
-        title = str(job.get('titulo', "")).lower()
-        description = str(job.get('descripcion', "")).lower()
-        company = str(job.get('empresa', "")).lower()
-        text = f"{title} {description} {company}"
-        
-        # Primero verificamos si aparece alguna palabra clave en el título (prioridad alta)
-        for kw in self.keywords:
-            if kw in title:
-                logger.debug(f"Keyword '{kw}' encontrada en el TÍTULO de la oferta: {job.get('titulo')}")
-                return True
-                
-        # Si el título no contiene palabras clave, verificamos en la descripción completa
-        # Consideramos coincidencia si al menos una palabra clave está presente
-        for kw in self.keywords:
-            if kw in text:
-                logger.debug(f"Keyword '{kw}' encontrada en oferta: {job.get('titulo')}")
-                return True
-        
-        # Si la oferta incluye términos relacionados con programación/tecnología, 
-        # aunque no coincida exactamente con nuestras keywords, la consideramos
-        tech_indicators = ['programador', 'developer', 'ingeniero', 'engineer', 'código', 'code', 
-                          'software', 'desarrollo', 'development', 'tech', 'tecnología', 'technology',
-                          'computer', 'computación', 'informática', 'it ', ' it,', 'database', 'datos',
-                          'data', 'web', 'app', 'aplicación', 'application']
-        
-        for indicator in tech_indicators:
-            if indicator in text:
-                logger.debug(f"Indicador tecnológico '{indicator}' encontrado en oferta: {job.get('titulo')}")
-                return True
-                
+        if text is None:
+            text = _job_haystack(job)
+
+        # ¿Aparece alguna palabra clave en el texto (título + descripción + empresa)?
+        # (El título está incluido en 'text', así que no hace falta una pasada aparte.)
+        kw = self._find_keyword(text)
+        if kw is not None:
+            logger.debug(f"Keyword '{kw}' encontrada en oferta: {_job_field(job, 'titulo', None)}")
+            return True
+
+        # Si no, ¿tiene algún indicador tecnológico?
+        indicator = self._find_tech_indicator(text)
+        if indicator is not None:
+            logger.debug(f"Indicador tecnológico '{indicator}' encontrado en oferta: {_job_field(job, 'titulo', None)}")
+            return True
+
         return False
 
-    def _matches_location(self, job: Dict[str, Any]) -> bool:
+    def _matches_location(self, job: Dict[str, Any], location: Optional[str] = None) -> bool:
         """
         Verifica si una oferta coincide con las ubicaciones de interés.
         Si no hay ubicaciones configuradas, todas las ofertas pasan este filtro.
         Las ofertas remotas se aceptan si se ha configurado 'remote'/'remoto' en las ubicaciones.
+        'location' es la ubicación ya preparada con _job_location (si no se pasa, se calcula).
         """
         # Si no hay restricciones de ubicación, aceptar todas
         if not self.target_locations:
             return True
 
-        location = str(job.get('ubicacion', "")).lower().strip()
+        if location is None:
+            location = _job_location(job)
         
         # Si no hay información de ubicación pero aceptamos remoto, asumimos que podría ser remoto
         if not location and self.target_remote:
-            logger.debug(f"Oferta sin ubicación aceptada como posible remoto: {job.get('titulo')}")
+            logger.debug(f"Oferta sin ubicación aceptada como posible remoto: {_job_field(job, 'titulo', None)}")
             return True
 
-        # Verificar si la ubicación está explícitamente en nuestra lista
-        for target_loc in self.target_locations:
-            if target_loc in location:
-                logger.debug(f"Ubicación '{target_loc}' coincide con '{location}' en oferta: {job.get('titulo')}")
-                return True
+        # Lo más común: la ubicación es exactamente una de las nuestras
+        if location in self._exact_locations:
+            logger.debug(f"Ubicación '{location}' coincide exactamente en oferta: {_job_field(job, 'titulo', None)}")
+            return True
+
+        # Si no, ¿contiene alguna de nuestras ubicaciones? (p. ej. 'Quito, Ecuador')
+        target_loc = self._find_location(location)
+        if target_loc is not None:
+            logger.debug(f"Ubicación '{target_loc}' coincide con '{location}' en oferta: {_job_field(job, 'titulo', None)}")
+            return True
 
         # Verificar si buscamos remotas y esta es remota
-        if self.target_remote and any(term in location for term in ['remote', 'remoto', 'teletrabajo', 'trabajo a distancia', 'home office', 'trabajo desde casa']):
-            logger.debug(f"Oferta remota identificada: {job.get('titulo')} - {location}")
+        if self.target_remote and self._find_remote_term(location) is not None:
+            logger.debug(f"Oferta remota identificada: {_job_field(job, 'titulo', None)} - {location}")
             return True
 
-        logger.debug(f"Ubicación no coincide: '{location}' para oferta: {job.get('titulo')}")
+        logger.debug(f"Ubicación no coincide: '{location}' para oferta: {_job_field(job, 'titulo', None)}")
         return False
 
     def filter_jobs(self, job_offers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Aplica los filtros de keywords y ubicación a las ofertas recibidas.
         Devuelve las ofertas que pasan ambos filtros.
+        Las ofertas pueden ser dicts u objetos con esos mismos atributos.
         """
         if not job_offers:
             logger.warning("No hay ofertas para filtrar")
             return []
 
-        filtered = []
-        rejected_count = 0
-        
         logger.info(f"Filtrando {len(job_offers)} ofertas con {len(self.keywords)} keywords y {len(self.target_locations)} ubicaciones")
-        for job in job_offers:
-            try:
-                matches_keywords = self._matches_keywords(job)
-                matches_location = self._matches_location(job)
-                
-                if matches_keywords and matches_location:
-                    logger.debug(f"Oferta aceptada: {job.get('titulo')}")
-                    filtered.append(job)
-                else:
-                    rejected_count += 1
-                    if not matches_keywords:
-                        logger.debug(f"Oferta rechazada por keywords: {job.get('titulo')}")
-                    if not matches_location:
-                        logger.debug(f"Oferta rechazada por ubicación: {job.get('titulo')}")
-            except Exception as e:
-                logger.error(f"Error al filtrar oferta: {job.get('url', job.get('titulo', 'Desconocido'))}", exc_info=True)
-        
+        filtered, rejected_count = self._filter_batch(job_offers)
+        return self._finish_filtering(job_offers, filtered, rejected_count)
+
+    def filter_jobs_parallel(self, job_offers: List[Dict[str, Any]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Igual que filter_jobs (con el mismo fallback permisivo), pero repartiendo las
+        ofertas en trozos entre varios procesos para usar todos los núcleos.
+
+        Cada proceso reconstruye sus buscadores una sola vez al arrancar y solo devuelve
+        qué posiciones pasan, así que el resultado son los mismos dicts de entrada.
+        Con pocas ofertas (o un solo núcleo) no compensa arrancar procesos y se usa filter_jobs.
+        """
+        job_offers = list(job_offers)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(job_offers) < PARALLEL_MIN_JOBS:
+            return self.filter_jobs(job_offers)
+
+        logger.info(f"Filtrando {len(job_offers)} ofertas en {workers} procesos con {len(self.keywords)} keywords y {len(self.target_locations)} ubicaciones")
+        # Unos 4 trozos por proceso: si alguno tarda más, los demás siguen sacando trabajo
+        chunk_size = max(1, len(job_offers) // (workers * 4))
+        chunks = [job_offers[i:i + chunk_size] for i in range(0, len(job_offers), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_filter_worker,
+                                 initargs=(self._criteria(),)) as pool:
+            masks = list(pool.map(_filter_chunk_mask, chunks))
+
+        filtered = [job for chunk, mask in zip(chunks, masks) for job, keep in zip(chunk, mask) if keep]
+        return self._finish_filtering(job_offers, filtered, len(job_offers) - len(filtered))
+
+    def _finish_filtering(self, job_offers: List[Dict[str, Any]], filtered: List[Dict[str, Any]],
+                          rejected_count: int) -> List[Dict[str, Any]]:
+        """Registra el resultado del filtrado y aplica el fallback permisivo si no pasó ninguna."""
         logger.info(f"Filtrado completado: {len(filtered)} ofertas aceptadas, {rejected_count} rechazadas")
         
         # Si el resultado del filtrado es muy restrictivo (menos del 10% de ofertas), agregar un warning
@@ -174,3 +456,212 @@ class JobFilter:
                 return job_offers[:sample_size]
             
         return filtered
+
+    def filter_jobs_soa(self, titles: Iterable[Any], descriptions: Iterable[Any], locations: Iterable[Any],
+                        companies: Optional[Iterable[Any]] = None) -> "np.ndarray":
+        """
+        Filtro para datos en columnas (una secuencia por campo en vez de una lista de dicts),
+        p. ej. columnas sacadas de la base de datos o de un DataFrame. Así nos ahorramos
+        armar un dict por oferta y buscar cada campo en él.
+
+        Aplica los mismos criterios que filter_jobs, pero SIN fallback permisivo, y devuelve
+        una máscara booleana de numpy: True en las posiciones de las ofertas que pasan.
+        Si no se pasan 'companies', la empresa se toma como vacía.
+        """
+        if np is None:
+            raise ImportError("filter_jobs_soa necesita numpy (pip install numpy)")
+
+        titles = np.asarray(titles, dtype=object)
+        descriptions = np.asarray(descriptions, dtype=object)
+        locations = np.asarray(locations, dtype=object)
+        n = len(titles)
+        companies = np.full(n, "", dtype=object) if companies is None else np.asarray(companies, dtype=object)
+        if not (len(descriptions) == len(locations) == len(companies) == n):
+            raise ValueError("Todas las columnas de filter_jobs_soa deben tener el mismo largo")
+
+        mask = np.ones(n, dtype=bool)
+
+        if self.keywords and n:
+            find_keyword = self._find_keyword
+            find_tech_indicator = self._find_tech_indicator
+            # Mismo texto que _job_haystack, campo a campo
+            haystack = np.frompyfunc(lambda t, d, c: f"{t} {d} {c}".lower(), 3, 1)
+            has_keyword = np.frompyfunc(
+                lambda text: find_keyword(text) is not None or find_tech_indicator(text) is not None, 1, 1)
+            mask &= has_keyword(haystack(titles, descriptions, companies)).astype(bool)
+
+        if self.target_locations and n:
+            find_location = self._find_location
+            find_remote_term = self._find_remote_term
+            target_remote = self.target_remote
+            normalized = np.frompyfunc(lambda loc: str(loc).lower().strip(), 1, 1)(locations)
+            # Primero la coincidencia exacta para todas; lo demás solo para las que no coincidieron
+            location_mask = np.isin(normalized, list(self._exact_locations))
+            pending = ~location_mask
+            other_match = np.frompyfunc(
+                lambda loc: ((target_remote and not loc)
+                             or find_location(loc) is not None
+                             or (target_remote and find_remote_term(loc) is not None)), 1, 1)
+            if pending.any():
+                location_mask[pending] = other_match(normalized[pending]).astype(bool)
+            mask &= location_mask
+
+        return mask
+
+    def filter_jobs_batched(self, jobs: Iterable[Dict[str, Any]], batch_size: int = 4096) -> Iterator[Dict[str, Any]]:
+        """
+        Versión en streaming de filter_jobs: consume 'jobs' (cualquier iterable, p. ej. un
+        generador que va entregando ofertas de los scrapers) en lotes de 'batch_size' y
+        va devolviendo las que pasan los filtros, sin esperar a tener la lista completa.
+
+        OJO: a diferencia de filter_jobs, aquí NO hay fallback permisivo. En streaming no
+        sabemos si al final habrá pasado alguna, así que solo se entregan las que coinciden.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size debe ser al menos 1, recibido: {batch_size}")
+
+        iterator = iter(jobs)
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            filtered, _rejected = self._filter_batch(batch)
+            yield from filtered
+
+    def _filter_batch(self, job_offers: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Aplica los criterios (sin fallback) con el camino más rápido disponible.
+        Devuelve (ofertas aceptadas, número de rechazadas).
+
+        - Con el log en DEBUG, siempre el bucle detallado (explica cada decisión).
+        - Con Hyperscan o pyahocorasick, el bucle con esos buscadores: una pasada
+          por oferta sin importar cuántas keywords haya.
+        - Solo con regex, y si la lista es grande, las máscaras de pandas.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            return self._filter_loop_verbose(job_offers)
+        if self._regex_only and len(job_offers) >= PANDAS_MIN_JOBS and _load_pandas() is not None:
+            try:
+                filtered = self._filter_vectorized(job_offers)
+                return filtered, len(job_offers) - len(filtered)
+            except Exception:
+                # Algún registro raro (p. ej. algo que no es un dict): el bucle lo maneja uno a uno
+                logger.warning("Falló el filtrado con pandas, usando el filtrado oferta por oferta", exc_info=True)
+        return self._filter_loop(job_offers)
+
+    def _filter_loop(self, job_offers: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Filtra oferta por oferta. Devuelve (ofertas aceptadas, número de rechazadas).
+
+        Con el log en DEBUG usamos la versión que explica cada decisión. Si no, el bucle
+        rápido: mismos criterios que _matches_keywords/_matches_location pero en línea,
+        con todo lo que se consulta en cada vuelta guardado antes en variables locales
+        (en CPython leer una local es bastante más barato que self.algo) y sin armar
+        mensajes de debug que nadie va a ver.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            return self._filter_loop_verbose(job_offers)
+
+        check_keywords = bool(self.keywords)
+        check_location = bool(self.target_locations)
+        job_haystack = _job_haystack
+        job_location = _job_location
+        find_keyword = self._find_keyword
+        find_tech_indicator = self._find_tech_indicator
+        exact_locations = self._exact_locations
+        find_location = self._find_location
+        find_remote_term = self._find_remote_term
+        target_remote = self.target_remote
+
+        filtered = []
+        accept = filtered.append
+        rejected_count = 0
+        for job in job_offers:
+            try:
+                if check_keywords:
+                    text = job_haystack(job)
+                    if find_keyword(text) is None and find_tech_indicator(text) is None:
+                        rejected_count += 1
+                        continue
+                if check_location:
+                    location = job_location(job)
+                    if not ((target_remote and not location)
+                            or location in exact_locations
+                            or find_location(location) is not None
+                            or (target_remote and find_remote_term(location) is not None)):
+                        rejected_count += 1
+                        continue
+                accept(job)
+            except Exception:
+                logger.error(f"Error al filtrar oferta: {_job_field(job, 'url', _job_field(job, 'titulo', 'Desconocido'))}", exc_info=True)
+        return filtered, rejected_count
+
+    def _filter_loop_verbose(self, job_offers: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """Como _filter_loop, pero registrando en DEBUG por qué se acepta o rechaza cada oferta."""
+        filtered = []
+        rejected_count = 0
+        # Cada texto se arma una sola vez por oferta, y solo si hay criterios que lo usen
+        need_text = bool(self.keywords)
+        need_location = bool(self.target_locations)
+        for job in job_offers:
+            try:
+                text = _job_haystack(job) if need_text else None
+                location = _job_location(job) if need_location else None
+                matches_keywords = self._matches_keywords(job, text)
+                matches_location = self._matches_location(job, location)
+                
+                if matches_keywords and matches_location:
+                    logger.debug(f"Oferta aceptada: {_job_field(job, 'titulo', None)}")
+                    filtered.append(job)
+                else:
+                    rejected_count += 1
+                    if not matches_keywords:
+                        logger.debug(f"Oferta rechazada por keywords: {_job_field(job, 'titulo', None)}")
+                    if not matches_location:
+                        logger.debug(f"Oferta rechazada por ubicación: {_job_field(job, 'titulo', None)}")
+            except Exception as e:
+                logger.error(f"Error al filtrar oferta: {_job_field(job, 'url', _job_field(job, 'titulo', 'Desconocido'))}", exc_info=True)
+        return filtered, rejected_count
+
+    def _filter_vectorized(self, job_offers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Mismos criterios que _matches_keywords y _matches_location, pero aplicados
+        a todas las ofertas a la vez con máscaras booleanas de pandas.
+        Devuelve los mismos dicts de entrada (no copias) en su orden original.
+        """
+        pd = _load_pandas()
+        mask = pd.Series(True, index=range(len(job_offers)))
+
+        if self.keywords:
+            text = pd.Series([_job_haystack(job) for job in job_offers], dtype=object)
+            needles = sorted(self.keywords) + list(TECH_INDICATORS)
+            mask &= text.str.contains(_alternation(needles), regex=True)
+
+        if self.target_locations:
+            location = pd.Series([_job_location(job) for job in job_offers], dtype=object)
+            location_mask = (location.isin(self._exact_locations)
+                             | location.str.contains(_alternation(sorted(self.target_locations)), regex=True))
+            if self.target_remote:
+                location_mask |= location.eq("") | location.str.contains(_alternation(REMOTE_TERMS), regex=True)
+            mask &= location_mask
+
+        return [job for job, keep in zip(job_offers, mask.tolist()) if keep]
+
+
+# --- Procesos de filter_jobs_parallel ---
+
+# El JobFilter de cada proceso (lo crea _init_filter_worker al arrancar el proceso)
+_worker_filter: Optional[JobFilter] = None
+
+
+def _init_filter_worker(criteria: Dict[str, Any]) -> None:
+    """Inicializador de cada proceso: reconstruye el filtro y sus buscadores una sola vez."""
+    global _worker_filter
+    _worker_filter = JobFilter.from_criteria(criteria)
+
+
+def _filter_chunk_mask(chunk: List[Dict[str, Any]]) -> List[bool]:
+    """Filtra un trozo en el proceso y devuelve, para cada oferta, si pasa o no."""
+    filtered, _rejected = _worker_filter._filter_batch(chunk)
+    accepted = {id(job) for job in filtered}
+    return [id(job) in accepted for job in chunk]
@@ -141,9 +141,10 @@ def run_job_search_pipeline():
         http_client.close()
         return
 
-    all_keywords = (config.get('job_titles', []) or []) + \
-                   (config.get('tools_technologies', []) or []) + \
-                   (config.get('topics', []) or [])
+    # La config es de solo lectura (tuplas): armamos nuestra propia lista
+    all_keywords = [*(config.get('job_titles') or ()),
+                    *(config.get('tools_technologies') or ()),
+                    *(config.get('topics') or ())]
     main_location = (config.get('locations', []) or [None])[0]
 
     # Construir varios conjuntos de parámetros de búsqueda para aumentar la cobertura
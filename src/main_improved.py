@@ -176,9 +176,10 @@ class JobSearchPipeline:
     
     def create_search_parameters(self):
         """Crea variaciones de parámetros de búsqueda para obtener más resultados"""
-        all_keywords = (self.config.get('job_titles', []) or []) + \
-                      (self.config.get('tools_technologies', []) or []) + \
-                      (self.config.get('topics', []) or [])
+        # La config es de solo lectura (tuplas): armamos nuestra propia lista
+        all_keywords = [*(self.config.get('job_titles') or ()),
+                        *(self.config.get('tools_technologies') or ()),
+                        *(self.config.get('topics') or ())]
         main_location = (self.config.get('locations', []) or [None])[0]
         
         # Parámetros principales
@@ -15,32 +15,73 @@ usar su método 'insert_job_offers' para guardar los datos.
 
 import sqlite3
 import logging
-from typing import List, Dict, Any
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 from src.utils import config_loader
 
 logger = logging.getLogger(__name__)
 
+# Si 'database_name' vale esto, la BD vive solo en memoria (ideal para pruebas).
+MEMORY_DB_NAME = ":memory:"
+
 class DatabaseManager:
-    def __init__(self):
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            db_path: Ruta del archivo .db a usar, o ":memory:" para una BD solo en
+                memoria. Si es None, se usa 'database_name' de la configuración
+                (dentro de data/ del proyecto).
+        """
         logger.info("Inicializando el DatabaseManager...")
+        # Conexión que mantiene viva la BD en memoria (None si la BD está en disco)
+        self._keepalive_conn = None
         try:
             config = config_loader.get_config()
             db_config = config.get('data_storage', {}).get('sqlite', {})
             db_filename = db_config.get('database_name', 'jobs_default.db')
             self.table_name = db_config.get('table_name', 'ofertas_empleo_default')
-            self.db_path = config_loader.PROJECT_ROOT / "data" / db_filename
+            if db_path is not None:
+                db_filename = str(db_path)
+            self.in_memory = db_filename == MEMORY_DB_NAME
+
+            if self.in_memory:
+                # Usamos una BD en memoria con nombre propio y caché compartida: así
+                # todas las conexiones de esta instancia ven los mismos datos, y la
+                # conexión 'keepalive' evita que SQLite la destruya entre operaciones.
+                self.db_path = f"file:jobs_mem_{id(self)}?mode=memory&cache=shared"
+                self._keepalive_conn = sqlite3.connect(self.db_path, uri=True)
+            else:
+                if db_path is not None:
+                    self.db_path = Path(db_path)
+                else:
+                    self.db_path = config_loader.PROJECT_ROOT / "data" / db_filename
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
             logger.info(f"Ruta de la base de datos configurada: {self.db_path}")
             logger.info(f"Tabla a usar: {self.table_name}")
 
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self._initialize_database()
 
         except Exception as e:
             logger.exception("¡Error crítico durante la inicialización del DatabaseManager! No se podrá usar la BD.")
             raise e
 
+    def _connect(self) -> sqlite3.Connection:
+        """Abre una conexión nueva a la BD (en disco o en memoria compartida)."""
+        conn = sqlite3.connect(self.db_path, timeout=10, uri=self.in_memory)
+        if not self.in_memory:
+            # Con WAL (ver _initialize_database), NORMAL sigue siendo seguro ante
+            # caídas de la app y evita un fsync en cada COMMIT. Es por conexión.
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def close(self):
+        """Libera la BD en memoria, si la hay. Para BD en disco no hace nada."""
+        if self._keepalive_conn is not None:
+            self._keepalive_conn.close()
+            self._keepalive_conn = None
+
     def _initialize_database(self):
         logger.debug(f"Asegurando que la tabla '{self.table_name}' exista en {self.db_path}...")
         create_table_sql = f"""
@@ -57,10 +98,24 @@ class DatabaseManager:
         );
         """
         try:
-            with sqlite3.connect(self.db_path, timeout=10) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                logger.debug(f"Ejecutando: {create_table_sql}")
-                cursor.execute(create_table_sql)
+                if not self.in_memory:
+                    # WAL queda guardado en el archivo: basta con fijarlo una vez.
+                    # Los lectores no bloquean al escritor y cada COMMIT es un append.
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                # Si la tabla ya existe no lanzamos el DDL: un CREATE (aunque sea
+                # IF NOT EXISTS) pide bloqueo de escritura; la consulta a
+                # sqlite_master es solo una lectura.
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                    (self.table_name,)
+                )
+                if cursor.fetchone():
+                    logger.debug(f"La tabla '{self.table_name}' ya existe. Omitiendo CREATE TABLE.")
+                else:
+                    logger.debug(f"Ejecutando: {create_table_sql}")
+                    cursor.execute(create_table_sql)
             logger.info(f"Tabla '{self.table_name}' asegurada/creada exitosamente.")
         except sqlite3.Error as e:
             logger.exception(f"Error al inicializar la base de datos o crear la tabla '{self.table_name}': {e}")
@@ -82,6 +137,7 @@ class DatabaseManager:
 
         now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         data_to_insert = []
+        seen_urls = set()
         for job in job_offers:
             data_tuple = (
                 job.get('titulo'),
@@ -94,7 +150,12 @@ class DatabaseManager:
                 now_str
             )
             if data_tuple[5]:
-                data_to_insert.append(data_tuple)
+                # Los duplicados dentro del mismo lote los quitamos aquí (gana la
+                # primera oferta, igual que con INSERT OR IGNORE); los que ya
+                # estaban en la tabla los sigue descartando el UNIQUE de 'url'.
+                if data_tuple[5] not in seen_urls:
+                    seen_urls.add(data_tuple[5])
+                    data_to_insert.append(data_tuple)
             else:
                 logger.warning(f"Oferta omitida por no tener URL: {job.get('titulo', 'Sin título')}")
 
@@ -104,7 +165,7 @@ class DatabaseManager:
 
         try:
             inserted_count = 0
-            with sqlite3.connect(self.db_path, timeout=10) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.executemany(sql, data_to_insert)
                 inserted_count = conn.total_changes
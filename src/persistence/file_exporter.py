@@ -7,6 +7,7 @@ Exportador de Datos a Archivos (por ahora, solo CSV).
 """
 
 import csv
+import io
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -37,6 +38,21 @@ CSV_HEADERS = [
 ]
 
 
+def _write_csv(file_path: Path, rows: List[Dict[str, Any]]):
+    """
+    Escribe las ofertas en 'file_path' con las cabeceras estándar.
+
+    Todo el CSV se arma primero en memoria (StringIO) y luego va al archivo en
+    una sola escritura, en vez de muchas escrituras pequeñas fila a fila.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_HEADERS, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(rows)
+    with open(file_path, mode='w', encoding='utf-8', newline='') as csvfile:
+        csvfile.write(buffer.getvalue())
+
+
 def export_to_csv(job_offers: List[Dict[str, Any]], is_filtered: bool = True, unfiltered_offers: Optional[List[Dict[str, Any]]] = None):
     """ 
     Exporta una lista de ofertas de empleo a archivos CSV.
@@ -97,10 +113,7 @@ def export_to_csv(job_offers: List[Dict[str, Any]], is_filtered: bool = True, un
         if job_offers:
             logger.info(f"Exportando {len(job_offers)} ofertas filtradas a: {filtered_file_path}")
             try:
-                with open(filtered_file_path, mode='w', encoding='utf-8', newline='') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADERS, extrasaction='ignore')
-                    writer.writeheader()
-                    writer.writerows(job_offers)
+                _write_csv(filtered_file_path, job_offers)
                 logger.info(f"¡Exportación de ofertas filtradas completada! {len(job_offers)} filas escritas.")
             except (IOError, csv.Error, ValueError) as e:
                 logger.error(f"Error al escribir el archivo CSV filtrado en {filtered_file_path}: {e}", exc_info=True)
@@ -112,10 +125,7 @@ def export_to_csv(job_offers: List[Dict[str, Any]], is_filtered: bool = True, un
         if unfiltered_offers:
             logger.info(f"Exportando {len(unfiltered_offers)} ofertas sin filtrar a: {unfiltered_file_path}")
             try:
-                with open(unfiltered_file_path, mode='w', encoding='utf-8', newline='') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADERS, extrasaction='ignore')
-                    writer.writeheader()
-                    writer.writerows(unfiltered_offers)
+                _write_csv(unfiltered_file_path, unfiltered_offers)
                 logger.info(f"¡Exportación de todas las ofertas completada! {len(unfiltered_offers)} filas escritas.")
             except (IOError, csv.Error, ValueError) as e:
                 logger.error(f"Error al escribir el archivo CSV sin filtrar en {unfiltered_file_path}: {e}", exc_info=True)
@@ -13,38 +13,78 @@ guardamos aparte en el archivo '.env' para mantenerlos seguros.
 Funciones:
     load_config(): Carga la configuración la primera vez y la guarda.
     get_config(): Devuelve la configuración ya cargada (llama a load_config si es necesario).
+    get_config_section(name): Devuelve una sola sección de settings.yaml sin cargar el resto.
+    get_settings(): La misma configuración, pero con acceso por atributos (settings.sources.apis).
+    reset_config(): Olvida la configuración cargada (la próxima llamada vuelve a leer settings.yaml).
+    reset_for_tests(): Como reset_config(), pero también vuelve a cargar el .env la próxima vez.
     get_secret(key): Obtiene un secreto específico (ej: API Key) desde las variables de entorno.
+    reset_secrets(): Olvida los secretos ya leídos (para tests que cambian el entorno).
+
+La configuración que devuelven es de SOLO LECTURA: los diccionarios vienen como
+types.MappingProxyType y las listas como tuplas. Así todos los módulos pueden
+compartir el mismo objeto sin hacer copias defensivas. Quien necesite modificar
+algo, que se haga su propia copia (dict(...), list(...)).
 """
 
 import yaml         # Necesitamos PyYAML para leer archivos .yaml (¡recuerda instalarlo!)
+import functools    # Para memoizar get_config() con lru_cache
 import os           # Para interactuar con el sistema operativo, sobre todo para leer variables de entorno
 import logging      # Para registrar mensajes importantes o errores
+import threading    # Para que la carga inicial sea segura si varios hilos arrancan a la vez
+import pickle       # Para la caché en disco de settings.yaml ya parseado
+import hashlib      # Huella del contenido de settings.yaml para validar esa caché
+import sys          # Para saber en qué sistema estamos (carpeta de caché por usuario)
+import types        # MappingProxyType, para entregar la config congelada
+import contextlib   # Para abrir settings.yaml con un 'with' que también cierra el mmap
+import mmap         # Para leer settings.yaml como bytes mapeados en memoria
+import stat         # S_ISREG, para comprobar que settings.yaml / .env son archivos normales
+import re           # Para quitar los comentarios al final de las líneas del .env
 from pathlib import Path  # La forma moderna y robusta de manejar rutas de archivos en Python
 from dotenv import load_dotenv # La librería para cargar el archivo .env (¡instalar python-dotenv!)
-from typing import Optional, Dict, Any # Para nuestros type hints
+from typing import Optional, Dict, Any, Iterator, Mapping, Set, Tuple, Union # Para nuestros type hints
 
-# Configuración básica del logger aquí, por si necesitamos loguear algo ANTES
-# de que setup_logging() (de logging_config.py) sea llamado.
-# Una vez setup_logging() se ejecute, esta configuración será reemplazada.
-logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(name)s - %(message)s')
+# Ojo: aquí NO llamamos a logging.basicConfig(). Importar este módulo no debe
+# tocar el logger raíz; de eso se encarga setup_logging() (logging_config.py).
+# El NullHandler solo evita el aviso de "no handlers" si nadie configuró nada.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Si PyYAML se compiló con libyaml usamos su cargador en C (mucho más rápido);
+# si no, el SafeLoader de Python puro. Ambos son igual de seguros que safe_load().
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 # --- Variables Globales del Módulo ---
 
 # Aquí guardaremos la configuración una vez leída. Usamos None al principio.
 # Esto es un truco simple (patrón Singleton a nivel módulo) para asegurarnos
 # de que leemos los archivos del disco UNA SOLA VEZ, ¡más eficiente!
-_config: Optional[Dict[str, Any]] = None
+_config: Optional[Mapping[str, Any]] = None
+
+# Secciones sueltas ya construidas por get_config_section() (antes de cargar todo)
+_MISSING = object()
+_sections: Dict[str, Any] = {}
+
+# Candado para la primera carga: si varios hilos llaman a load_config() a la vez,
+# solo uno lee los archivos y los demás esperan y reutilizan su resultado.
+_config_lock = threading.Lock()
+
+# ¿Ya cargamos el .env en este proceso? Las variables de entorno se cargan una
+# sola vez por intérprete: reset_config() recarga settings.yaml pero no el .env.
+_dotenv_loaded: bool = False
 
 # --- Definición de Rutas ---
 
 # Calculamos la ruta raíz del proyecto. ¡Esto es súper útil!
 # Asumimos la estructura: project_root/src/utils/config_loader.py
 # Path(__file__) es la ruta a ESTE archivo.
-# .parent nos sube un nivel en la jerarquía de carpetas.
+# .parents[n] nos da el ancestro n+1 niveles arriba, sin ir encadenando .parent.
 try:
-    # Esta es la forma robusta de encontrar la raíz (tres niveles arriba de src/utils)
-    PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+    # Esta es la forma robusta de encontrar la raíz (tres niveles arriba de src/utils).
+    # La resolvemos una vez, así todas las rutas de abajo quedan absolutas y canónicas.
+    PROJECT_ROOT = Path(__file__).resolve(strict=False).parents[2]
     # Construimos la ruta al directorio de configuración /config/
     CONFIG_DIR = PROJECT_ROOT / "config"
     # Y las rutas a los archivos específicos que leeremos.
@@ -54,7 +94,7 @@ except NameError:
     # Si __file__ no está definido (puede pasar en algunos entornos interactivos),
     # usamos el directorio actual como fallback, aunque podría no ser correcto.
     logger.warning("__file__ no está definido. Usando directorio actual como base para buscar config. ¡Esto podría fallar!")
-    PROJECT_ROOT = Path('.')
+    PROJECT_ROOT = Path('.').resolve(strict=False)
     CONFIG_DIR = PROJECT_ROOT / "config"
     SETTINGS_FILE = CONFIG_DIR / "settings.yaml"
     ENV_FILE = CONFIG_DIR / ".env"
@@ -62,7 +102,7 @@ except NameError:
 
 # --- Funciones Principales ---
 
-def load_config() -> Optional[Dict[str, Any]]:
+def load_config() -> Optional[Mapping[str, Any]]:
     """
     Carga la configuración desde 'settings.yaml' y el archivo '.env'.
 
@@ -70,30 +110,48 @@ def load_config() -> Optional[Dict[str, Any]]:
     Las llamadas siguientes devuelven la configuración ya almacenada en _config.
 
     Returns:
-        Optional[Dict[str, Any]]: Diccionario con la config de settings.yaml,
-                                  o None si ocurre un error crítico irrecuperable.
+        Optional[Mapping[str, Any]]: La config de settings.yaml (congelada, de solo
+                                     lectura), o None si ocurre un error crítico irrecuperable.
 
     Raises:
         FileNotFoundError: Si no se encuentra settings.yaml (considerado crítico).
         yaml.YAMLError: Si settings.yaml tiene errores de formato (crítico).
         Exception: Para otros errores inesperados durante la carga (crítico).
     """
-    global _config
     # Si ya tenemos la config cargada en _config, ¡la devolvemos directamente!
+    # (Camino rápido sin candado: una vez cargada, nadie más entra a la sección crítica.)
     if _config is not None:
         logger.debug("Configuración ya cargada previamente. Devolviendo...")
         return _config
 
-    # Si no, es la primera vez, ¡a cargarla!
+    with _config_lock:
+        # Volvemos a mirar: otro hilo pudo cargarla mientras esperábamos el candado.
+        if _config is not None:
+            return _config
+        return _load_config_locked()
+
+
+def _load_config_locked() -> Optional[Mapping[str, Any]]:
+    """La carga real de load_config(). Solo se llama con _config_lock tomado."""
+    global _config, _dotenv_loaded
+
+    # Es la primera vez, ¡a cargarla!
     logger.info("Iniciando carga de configuración (primera vez)...")
 
     try:
         # --- 1. Cargar Secretos desde .env ---
         # Le decimos a python-dotenv dónde está nuestro archivo .env.
-        if ENV_FILE.is_file():
+        if _dotenv_loaded:
+            logger.debug("El archivo .env ya se cargó en este proceso. No se vuelve a leer.")
+        elif _regular_file(ENV_FILE):
             # override=True: si una variable ya existe en el entorno del S.O.,
             # la del archivo .env la sobreescribe. Útil en desarrollo.
-            loaded = load_dotenv(dotenv_path=ENV_FILE, override=True)
+            loaded = _load_env_file(ENV_FILE, override=True)
+            _dotenv_loaded = True
+            # Con override=True el .env puede pisar variables que ya habíamos leído.
+            reset_secrets()
+            # Y revisamos una sola vez si quedó algún placeholder sin cambiar.
+            _scan_placeholders()
             if loaded:
                 logger.info(f"Variables de entorno cargadas desde: {ENV_FILE}")
             else:
@@ -106,21 +164,33 @@ def load_config() -> Optional[Dict[str, Any]]:
 
         # --- 2. Cargar Configuración Principal desde settings.yaml ---
         logger.info(f"Cargando configuración principal desde: {SETTINGS_FILE}")
-        if not SETTINGS_FILE.is_file():
+        if not _regular_file(SETTINGS_FILE):
             # Consideramos esto un error crítico. Sin settings, no sabemos qué hacer.
             logger.error(f"¡ERROR CRÍTICO! No se encontró el archivo de configuración principal: {SETTINGS_FILE}")
             # Lanzamos la excepción para que el programa principal sepa que no puede continuar.
             raise FileNotFoundError(f"Archivo de configuración no encontrado: {SETTINGS_FILE}")
 
-        # Abrimos y leemos el archivo YAML. 'safe_load' es la forma segura.
-        with open(SETTINGS_FILE, 'r', encoding='utf-8') as file:
-            loaded_yaml_config = yaml.safe_load(file)
-            if not loaded_yaml_config: # Si el archivo existe pero está vacío o es inválido
-                 logger.warning(f"El archivo {SETTINGS_FILE} está vacío o no es un YAML válido.")
-                 _config = {} # Usamos un dict vacío como config en este caso.
-            else:
-                 _config = loaded_yaml_config # ¡Guardamos la config leída en nuestra variable global!
-                 logger.info("Archivo settings.yaml cargado y parseado exitosamente.")
+        # Si settings.yaml no cambió desde la última vez, usamos la copia ya parseada
+        # que dejamos en la caché del usuario y nos saltamos el YAML por completo.
+        stamp = _settings_stamp()
+        cache_hit, loaded_yaml_config = _read_settings_cache(stamp)
+        if cache_hit:
+            logger.info(f"Configuración tomada de la caché {_settings_cache_path()} (settings.yaml sin cambios).")
+        else:
+            # Abrimos y leemos el archivo YAML con el cargador seguro (el de C si está disponible).
+            # (Lo registramos para poder confirmar que libyaml está instalado en producción.)
+            logger.info(f"Cargador YAML en uso: {_SafeLoader.__name__}")
+            with _settings_bytes() as raw:
+                loaded_yaml_config = yaml.load(raw, Loader=_SafeLoader)
+            _write_settings_cache(stamp, loaded_yaml_config)
+
+        if not loaded_yaml_config: # Si el archivo existe pero está vacío o es inválido
+             logger.warning(f"El archivo {SETTINGS_FILE} está vacío o no es un YAML válido.")
+             _config = _freeze({}) # Usamos un dict vacío como config en este caso.
+        else:
+             # ¡Guardamos la config leída en nuestra variable global! (congelada, ver _freeze)
+             _config = _freeze(loaded_yaml_config)
+             logger.info("Archivo settings.yaml cargado y parseado exitosamente.")
 
         # Aquí podríamos añadir validaciones más profundas de la estructura de _config si quisiéramos.
 
@@ -140,15 +210,221 @@ def load_config() -> Optional[Dict[str, Any]]:
         raise e # Relanzamos para indicar el fallo crítico.
 
 
-def get_config() -> Optional[Dict[str, Any]]:
+# Un '#' precedido de espacio o tab empieza un comentario (la misma regla que dotenv)
+_ENV_INLINE_COMMENT = re.compile(r'\s+#.*')
+
+def _load_env_file(path: Path, override: bool = True) -> bool:
+    """
+    Carga un .env sencillo (líneas KEY=VALUE) en os.environ.
+
+    Nuestro .env es plano, así que lo leemos nosotros en una pasada en vez de
+    pasar por toda la maquinaria de python-dotenv. Si aparece algo que no
+    sabemos interpretar igual que dotenv (expansión ${VAR}, comillas que no
+    cierran, escapes con barra) le pasamos el archivo entero a load_dotenv().
+
+    Args:
+        path (Path): Ruta al archivo .env.
+        override (bool): Si True, pisa las variables que ya existan en el entorno.
+
+    Returns:
+        bool: True si se cargó al menos una variable (igual que load_dotenv()).
+    """
+    text = path.read_text(encoding='utf-8-sig')
+    parsed: Dict[str, str] = {}
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('export '):
+            line = line[len('export '):].lstrip()
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        if not sep or not key:
+            # dotenv tampoco carga nada para una línea sin '='
+            continue
+        value = value.strip()
+        if '${' in value or '\\' in value:
+            return load_dotenv(dotenv_path=path, override=override)
+        if value[:1] in ('"', "'"):
+            quote = value[0]
+            end = value.find(quote, 1)
+            if end == -1 or value[end + 1:].strip()[:1] not in ('', '#'):
+                # Comillas multilínea o cosas raras detrás: mejor que lo haga dotenv
+                return load_dotenv(dotenv_path=path, override=override)
+            value = value[1:end]
+        else:
+            # Comentario al final de la línea ("KEY=valor  # nota" o con tab), como en dotenv
+            value = _ENV_INLINE_COMMENT.sub('', value).rstrip()
+        parsed[key] = value
+
+    for key, value in parsed.items():
+        if override:
+            os.environ[key] = value
+        else:
+            os.environ.setdefault(key, value)
+    return bool(parsed)
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Devuelve una versión de solo lectura de lo que sale del YAML: los dicts
+    pasan a MappingProxyType y las listas a tuplas (recursivamente). Los
+    escalares se quedan como están.
+    """
+    if isinstance(obj, dict):
+        return types.MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+@contextlib.contextmanager
+def _settings_bytes() -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Abre settings.yaml como bytes mapeados en memoria (mmap) para pasárselos
+    directo al parser YAML: sin capa de texto de Python de por medio, libyaml
+    detecta y valida la codificación (UTF-8/UTF-16 con BOM) por su cuenta.
+    """
+    with open(SETTINGS_FILE, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b"" # mmap no admite archivos vacíos
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+# --- Caché en disco de settings.yaml ya parseado ---
+
+# La caché NO vive junto a settings.yaml sino en la carpeta de caché del usuario
+# (~/.cache/buscador_empleo_inteligente en Linux): cargarla implica un pickle.loads,
+# y no queremos que quien pueda escribir en config/ pueda meter código ahí.
+# Cabecera del archivo: identificador + huella (BLAKE2b) del CONTENIDO de settings.yaml.
+# Si settings.yaml cambia, cambia la huella y la caché se ignora (y se reescribe).
+_CACHE_MAGIC = b"BEICFG02"
+_CACHE_DIGEST_SIZE = 32
+_CACHE_HEADER_SIZE = len(_CACHE_MAGIC) + _CACHE_DIGEST_SIZE # 40 bytes
+
+# Con CONFIG_CACHE_DISABLE=1 siempre se lee el YAML (útil para depurar y en los tests)
+CACHE_DISABLE_ENV = "CONFIG_CACHE_DISABLE"
+# Con CONFIG_CACHE_DIR se puede elegir otra carpeta para la caché
+CACHE_DIR_ENV = "CONFIG_CACHE_DIR"
+
+
+def _cache_dir() -> Path:
+    """Carpeta de caché de este usuario para el proyecto."""
+    custom = os.environ.get(CACHE_DIR_ENV)
+    if custom:
+        return Path(custom)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "buscador_empleo_inteligente"
+
+
+def _settings_cache_path() -> Path:
+    """Archivo de caché para ESTE settings.yaml (el nombre sale de su ruta, por si hay varios checkouts)."""
+    path_id = hashlib.blake2b(str(SETTINGS_FILE).encode("utf-8"), digest_size=8).hexdigest()
+    return _cache_dir() / f"settings-{path_id}.pkl"
+
+
+def _regular_file(path: Union[str, Path]) -> bool:
+    """
+    Como Path.is_file(), pero con un único os.stat() y sin crear objetos Path
+    de por medio. Devuelve False si la ruta no existe.
+    """
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _settings_stamp() -> bytes:
+    """Huella del contenido actual de settings.yaml (leerlo y hashearlo es mucho más barato que parsearlo)."""
+    with _settings_bytes() as raw:
+        return hashlib.blake2b(raw, digest_size=_CACHE_DIGEST_SIZE).digest()
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get(CACHE_DISABLE_ENV, "").strip().lower() not in ("1", "true", "yes", "si", "sí")
+
+
+def _cache_file_trusted(cache_path: Path) -> bool:
+    """
+    En POSIX, solo confiamos en una caché que sea nuestra y que nadie más pueda
+    modificar (ni grupo ni otros con permiso de escritura).
+    """
+    if os.name != "posix":
+        return True
+    try:
+        st = os.stat(cache_path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _read_settings_cache(stamp: bytes) -> Tuple[bool, Any]:
+    """
+    Intenta leer la caché de settings.yaml. Devuelve (True, datos) si existe,
+    es de confianza y corresponde a la huella indicada; (False, None) si no.
+    """
+    if not _cache_enabled():
+        return False, None
+    cache_path = _settings_cache_path()
+    try:
+        raw = cache_path.read_bytes()
+    except OSError:
+        return False, None # No hay caché todavía (lo normal la primera vez)
+    if raw[:len(_CACHE_MAGIC)] != _CACHE_MAGIC or len(raw) < _CACHE_HEADER_SIZE:
+        return False, None
+    if not _cache_file_trusted(cache_path):
+        logger.warning(f"La caché de configuración {cache_path} la pueden modificar otros usuarios. Se ignora.")
+        return False, None
+    if raw[len(_CACHE_MAGIC):_CACHE_HEADER_SIZE] != stamp:
+        logger.debug("settings.yaml cambió desde la última caché. Se vuelve a parsear.")
+        return False, None
+    try:
+        return True, pickle.loads(raw[_CACHE_HEADER_SIZE:])
+    except Exception:
+        logger.warning(f"Caché de configuración dañada en {_settings_cache_path()}. Se ignora.", exc_info=True)
+        return False, None
+
+
+def _write_settings_cache(stamp: bytes, data: Any) -> None:
+    """Guarda 'data' como caché de settings.yaml. Si no se puede, no pasa nada: solo es una caché."""
+    if not _cache_enabled():
+        return
+    cache_path = _settings_cache_path()
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        payload = _CACHE_MAGIC + stamp + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Solo el dueño puede leer/escribir la caché (0o600), desde el primer byte
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(payload)
+        # os.replace es atómico: otro proceso nunca ve una caché a medio escribir
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        logger.debug(f"No se pudo escribir la caché de configuración en {cache_path}.", exc_info=True)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Optional[Mapping[str, Any]]:
     """
     Obtiene el diccionario de configuración cargado.
 
     Llama a load_config() si la configuración aún no ha sido cargada.
     Es la función que usarán normalmente los otros módulos.
+    Está memoizada: tras la primera llamada devuelve directamente el mismo dict,
+    sin pasar por load_config() ni sus logs. Para forzar una recarga, usar reset_config().
 
     Returns:
-        Optional[Dict[str, Any]]: El diccionario de configuración, o None si falló la carga.
+        Optional[Mapping[str, Any]]: La configuración (de solo lectura), o None si falló la carga.
     """
     # Simplemente llama a load_config, que se encarga de la lógica de cargar solo una vez.
     config_data = load_config()
@@ -160,12 +436,165 @@ def get_config() -> Optional[Dict[str, Any]]:
     return config_data
 
 
+@functools.lru_cache(maxsize=1)
+def get_settings() -> types.SimpleNamespace:
+    """
+    Devuelve la configuración como un árbol de SimpleNamespace, para escribir
+    settings.sources.apis en vez de config.get('sources', {}).get('apis', {}).
+
+    Se construye una sola vez a partir de get_config() (hasta reset_config()).
+    Las secciones que falten NO existen como atributo: para las opcionales,
+    usar getattr(settings, 'seccion', None). Las claves que no son nombres
+    válidos de Python siguen disponibles con getattr(settings, 'mi-clave').
+    get_config() sigue devolviendo el mapping de siempre.
+    """
+    return _compile_config(get_config() or {})
+
+
+def _compile_config(cfg: Any) -> Any:
+    """Convierte los mappings de la config en SimpleNamespace (recursivamente); las listas quedan como tuplas."""
+    if isinstance(cfg, Mapping):
+        return types.SimpleNamespace(**{str(key): _compile_config(value) for key, value in cfg.items()})
+    if isinstance(cfg, (list, tuple)):
+        return tuple(_compile_config(item) for item in cfg)
+    return cfg
+
+
+def get_config_section(name: str, default: Any = None) -> Any:
+    """
+    Devuelve solo una sección de primer nivel de settings.yaml (ej: 'logging').
+
+    Si la configuración completa ya está cargada, sale de ahí. Si no, NO la carga
+    entera: recorre el árbol de nodos del YAML y construye únicamente los objetos
+    de esa sección (útil para, p. ej., configurar el logging al arrancar un CLI
+    que no necesita el resto). El resultado se memoriza hasta reset_config().
+
+    Args:
+        name (str): Clave de primer nivel en settings.yaml.
+        default (Any): Valor a devolver si la sección no existe.
+
+    Raises:
+        FileNotFoundError: Si no existe settings.yaml (igual que load_config()).
+    """
+    if _config is not None:
+        return _config.get(name, default)
+
+    with _config_lock:
+        if _config is not None:
+            return _config.get(name, default)
+        if name not in _sections:
+            _sections[name] = _load_section(name)
+    value = _sections[name]
+    return default if value is _MISSING else value
+
+
+def _load_section(name: str) -> Any:
+    """Construye solo la sección 'name' de settings.yaml (o _MISSING si no está)."""
+    if not _regular_file(SETTINGS_FILE):
+        raise FileNotFoundError(f"Archivo de configuración no encontrado: {SETTINGS_FILE}")
+
+    # Si la caché en disco está al día, ya tenemos todo parseado: no hay YAML que recorrer
+    cache_hit, cached = _read_settings_cache(_settings_stamp())
+    if cache_hit:
+        return _freeze(cached.get(name, _MISSING)) if isinstance(cached, dict) else _MISSING
+
+    with _settings_bytes() as raw:
+        loader = _SafeLoader(raw)
+        try:
+            root = loader.get_single_node() # Árbol de nodos, sin construir objetos Python
+            if not isinstance(root, yaml.MappingNode):
+                return _MISSING
+            loader.flatten_mapping(root) # Resuelve las claves '<<' (merge) de primer nivel
+            for key_node, value_node in root.value:
+                if loader.construct_object(key_node, deep=True) == name:
+                    return _freeze(loader.construct_object(value_node, deep=True))
+            return _MISSING
+        finally:
+            loader.dispose()
+
+
+def reset_config() -> None:
+    """
+    Olvida la configuración cargada: la próxima llamada a get_config() (o
+    load_config()) vuelve a leer settings.yaml desde disco. El .env NO se
+    vuelve a cargar (sus variables ya están en el entorno); para eso está
+    reset_for_tests().
+    """
+    global _config
+    with _config_lock:
+        _config = None
+        _sections.clear()
+        get_config.cache_clear()
+        get_settings.cache_clear()
+    reset_secrets()
+
+
+def reset_for_tests() -> None:
+    """
+    Deja el módulo como recién importado: olvida la configuración y también
+    que ya cargamos el .env, todo bajo el mismo candado. Pensado para tests
+    que apuntan ENV_FILE a otro archivo.
+    """
+    global _config, _dotenv_loaded
+    with _config_lock:
+        _config = None
+        _dotenv_loaded = False
+        _sections.clear()
+        get_config.cache_clear()
+        get_settings.cache_clear()
+    reset_secrets()
+
+
+# Prefijos típicos de los valores de ejemplo del .env ("TU_API_KEY_AQUI", etc.).
+_PLACEHOLDER_PREFIXES = ("TU_", "YOUR_", "PON_TU_", "INSERT_YOUR_")
+
+
+# Claves cuyo valor parece un placeholder. Se llena una vez al cargar el .env
+# (_scan_placeholders) y al leer por primera vez cada clave, así get_secret()
+# solo tiene que mirar si la clave está en el set.
+_placeholder_keys: Set[str] = set()
+
+
+def _scan_placeholders() -> None:
+    """Revisa el entorno una sola vez y avisa de los valores que parecen placeholders."""
+    for env_key, env_value in os.environ.items():
+        if env_value.startswith(_PLACEHOLDER_PREFIXES):
+            _placeholder_keys.add(env_key)
+            logger.error(f"¡ALERTA! El valor de '{env_key}' parece un placeholder. "
+                         f"¿Olvidaste poner la clave real en tu archivo .env?")
+
+
+@functools.lru_cache(maxsize=128)
+def _getenv_cached(key: str) -> str:
+    """
+    Lee una variable de entorno y recuerda el resultado. Si no existe lanza
+    KeyError, así lru_cache no guarda los fallos y una clave que se añada
+    después (p.ej. al cargar el .env) se encuentra en la siguiente llamada.
+    De paso apunta la clave en _placeholder_keys si su valor es un placeholder.
+    """
+    value = os.environ[key] # Directo a os.environ, sin pasar por os.getenv()
+    if value.startswith(_PLACEHOLDER_PREFIXES):
+        _placeholder_keys.add(key)
+    else:
+        _placeholder_keys.discard(key)
+    return value
+
+
+def reset_secrets() -> None:
+    """
+    Olvida los secretos ya leídos. Útil en tests que cambian variables de
+    entorno de una clave que ya se consultó.
+    """
+    _getenv_cached.cache_clear()
+    _placeholder_keys.clear()
+
+
 def get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
     """
     Obtiene un valor "secreto" desde las variables de entorno.
 
     Es la forma recomendada y segura para obtener API keys, contraseñas, etc.,
-    que fueron cargadas previamente desde el archivo .env por load_dotenv().
+    que fueron cargadas previamente desde el archivo .env por load_config().
 
     Args:
         key (str): El nombre de la variable de entorno a buscar (ej: "ADZUNA_APP_KEY").
@@ -176,22 +605,36 @@ def get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
         Optional[str]: El valor de la variable de entorno si existe, o el valor default.
                        Devuelve None si no existe y default es None.
     """
-    # Usamos os.getenv(), que es la forma estándar de leer variables de entorno.
-    # Es seguro porque devuelve None (o el default) si la variable no existe, no da error.
-    value = os.getenv(key, default)
+    # Las claves ya vistas salen de una caché pequeña (ver _getenv_cached);
+    # si la variable no existe devolvemos el default, como hacía os.getenv().
+    try:
+        value = _getenv_cached(key)
+        found = True
+    except KeyError:
+        value = default
+        found = False
 
     # Añadimos un log útil si no encontramos una clave esperada.
-    if value is None and default is None:
-        logger.warning(f"Variable de entorno/secreto '{key}' no encontrada y no se especificó valor por defecto.")
-    elif value == default and default is not None:
-         logger.debug(f"Variable de entorno/secreto '{key}' no encontrada. Usando valor por defecto.")
-    else:
-         # ¡NUNCA loguear el valor del secreto! Solo confirmar que se encontró.
-         logger.debug(f"Variable de entorno/secreto '{key}' encontrada.")
+    # (Cada mensaje se arma solo si su nivel está activo: nada de f-strings de balde.)
+    if not found and default is None:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(f"Variable de entorno/secreto '{key}' no encontrada y no se especificó valor por defecto.")
+    elif logger.isEnabledFor(logging.DEBUG):
+        # Solo armamos el mensaje si de verdad se va a ver.
+        if not found:
+            logger.debug(f"Variable de entorno/secreto '{key}' no encontrada. Usando valor por defecto.")
+        else:
+            # ¡NUNCA loguear el valor del secreto! Solo confirmar que se encontró.
+            logger.debug(f"Variable de entorno/secreto '{key}' encontrada.")
 
     # Una comprobación extra útil: ¿pusimos el placeholder en lugar de la clave real en .env?
-    placeholders = ["TU_", "YOUR_", "PON_TU_", "INSERT_YOUR_"]
-    if isinstance(value, str) and any(value.startswith(p) for p in placeholders):
+    # Los valores del entorno ya se revisaron al leerlos; aquí basta con mirar el set.
+    # (El default lo pone el código, pero también lo revisamos por si acaso.)
+    if found:
+        is_placeholder = key in _placeholder_keys
+    else:
+        is_placeholder = isinstance(value, str) and value.startswith(_PLACEHOLDER_PREFIXES)
+    if is_placeholder and logger.isEnabledFor(logging.ERROR):
         logger.error(f"¡ALERTA! El valor para '{key}' ('{value}') parece un placeholder. "
                      f"¿Olvidaste poner la clave real en tu archivo .env?")
         # Podríamos incluso devolver None o lanzar un error aquí para más seguridad.
@@ -199,9 +642,35 @@ def get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
 
     return value
 
+@functools.lru_cache(maxsize=128)
+def _split_path(dotted: str) -> Tuple[str, ...]:
+    """Parte 'a.b.c' en ('a', 'b', 'c'), una sola vez por ruta."""
+    return tuple(dotted.split('.'))
+
+
+def _dig(cfg: Any, dotted: str, default: Any = None) -> Any:
+    """
+    Baja por la config siguiendo una ruta con puntos, p.ej.
+    _dig(config, 'data_storage.sqlite.database_name', 'jobs.db').
+
+    Es lo mismo que encadenar .get('...', {}) pero sin crear un dict vacío
+    de relleno en cada nivel que falte. Devuelve default si algún tramo no existe.
+    """
+    current = cfg
+    for part in _split_path(dotted):
+        if not isinstance(current, Mapping):
+            return default
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
+            return default
+    return current
+
+
 # --- Ejemplo de Uso (Solo si corres este script directamente) ---
 if __name__ == '__main__':
     # Este bloque ayuda a probar que el módulo carga bien la config.
+    # Al correrlo suelto sí queremos ver los logs en consola.
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(name)s - %(message)s')
     print("--- Probando el Cargador de Configuración (config_loader.py) ---")
     # Necesitarás tener 'config/settings.yaml' y 'config/.env' creados para que funcione bien.
 
@@ -210,12 +679,12 @@ if __name__ == '__main__':
         configuracion = get_config()
         print("\n--- Configuración Cargada desde settings.yaml ---")
         if configuracion:
-             # Imprimimos algunas partes para verificar.
-             print(f"Nivel de Logging: {configuracion.get('logging', {}).get('level', 'No especificado')}")
-             print(f"Nombre BD: {configuracion.get('data_storage', {}).get('sqlite', {}).get('database_name', 'No especificado')}")
-             print(f"Exportar CSV?: {configuracion.get('data_storage', {}).get('csv', {}).get('export_enabled', 'No especificado')}")
-             print(f"Fuentes API keys: {list(configuracion.get('sources', {}).get('apis', {}).keys())}")
-             print(f"Fuentes Scraper keys: {list(configuracion.get('sources', {}).get('scrapers', {}).keys())}")
+             # Imprimimos algunas partes para verificar (con _dig, sin encadenar .get(..., {})).
+             print(f"Nivel de Logging: {_dig(configuracion, 'logging.level', 'No especificado')}")
+             print(f"Nombre BD: {_dig(configuracion, 'data_storage.sqlite.database_name', 'No especificado')}")
+             print(f"Exportar CSV?: {_dig(configuracion, 'data_storage.csv.export_enabled', 'No especificado')}")
+             print(f"Fuentes API keys: {list(_dig(configuracion, 'sources.apis', {}))}")
+             print(f"Fuentes Scraper keys: {list(_dig(configuracion, 'sources.scrapers', {}))}")
         else:
             print("La configuración principal (settings.yaml) no se pudo cargar (es None).")
 
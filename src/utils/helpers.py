@@ -12,6 +12,7 @@ específico, pero que nos ayudan a mantener el código limpio y DRY (Don't Repea
 quizás sea buena idea traerla aquí como una función helper!
 """
 
+import functools  # Para cachear normalizaciones repetidas.
 import logging
 import re               # Para limpieza con expresiones regulares.
 import unicodedata      # Para normalizar texto y quitar acentos.
@@ -19,9 +20,88 @@ from urllib.parse import urljoin # La forma más segura de unir URLs.
 from typing import Optional, List, Dict, Any # Type hints.
 from datetime import datetime, timedelta # Para manejo de fechas.
 
+# Numba es opcional: si está, los textos ASCII largos se normalizan con un bucle compilado.
+# No lo importamos aquí (numba tarda ~200 ms en cargar y casi todos los que usan helpers
+# nunca pasan por ese atajo): lo carga _get_normalize_ascii() la primera vez que hace falta.
+
 # Logger para nuestras herramientas.
 logger = logging.getLogger(__name__)
 
+# Para textos cortos (ubicaciones, títulos) la llamada al código compilado cuesta
+# más que re.sub + lower(), así que solo usamos Numba a partir de este tamaño.
+_NUMBA_MIN_LEN = 256
+
+# Cualquier tramo de espacios, tabs o saltos de línea (normalize_text lo deja en un solo espacio)
+_WS_RE = re.compile(r'\s+')
+
+# Solo se cachean textos de hasta este tamaño (ver normalize_text)
+_CACHE_MAX_LEN = 256
+
+# Tabla para quitar acentos con str.translate (una pasada en C). Se genera con el mismo
+# NFKD + ASCII que usamos de respaldo, así que el resultado es idéntico: cubre Latin-1
+# y Latin Extendido-A/B (á, ñ, ü, ç, ø, ł...). Lo que no esté aquí pasa por NFKD.
+_ACCENT_TABLE = str.maketrans({
+    chr(code): unicodedata.normalize('NFKD', chr(code)).encode('ascii', 'ignore').decode('ascii')
+    for code in range(0x80, 0x250)
+})
+
+@functools.lru_cache(maxsize=None)
+def _get_normalize_ascii():
+    """
+    Importa numpy + numba y compila el atajo ASCII de normalize_text, solo la
+    primera vez que se llama. Devuelve una función (texto, lowercase) -> texto,
+    o None si numba no está o no consigue compilar: entonces se usa la regex.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def normalize_ascii_bytes(buf, lowercase):
+        """
+        Pasos 1-3 de normalize_text sobre bytes ASCII, en una sola pasada:
+        colapsa los espacios en blanco, quita los de los extremos y
+        (opcional) pasa A-Z a minúsculas.
+        """
+        out = np.empty(buf.shape[0], np.uint8)
+        n = 0
+        pending_space = False
+        for b in buf:
+            # Los mismos blancos ASCII que '\s' en un patrón str:
+            # \t\n\v\f\r, \x1c-\x1f y ' '
+            if b == 32 or 9 <= b <= 13 or 28 <= b <= 31:
+                pending_space = n > 0 # Un blanco al inicio no cuenta
+                continue
+            if pending_space:
+                out[n] = 32
+                n += 1
+                pending_space = False
+            if lowercase and 65 <= b <= 90:
+                b = b | 0x20
+            out[n] = b
+            n += 1
+        return out[:n]
+
+    def normalize_ascii(text: str, lowercase: bool) -> str:
+        buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        return normalize_ascii_bytes(buf, lowercase).tobytes().decode('ascii')
+
+    # njit compila en la primera llamada: la hacemos aquí para que un fallo de
+    # Numba se note una sola vez y no en cada texto largo.
+    try:
+        ok = (normalize_ascii(" \tEjemplo  DE\ntexto ", True) == "ejemplo de texto"
+              and normalize_ascii("Ab  C", False) == "Ab C")
+    except Exception:
+        logger.warning("No se pudo compilar el atajo ASCII con Numba. Se usa la regex.", exc_info=True)
+        return None
+    if not ok:
+        logger.warning("El atajo ASCII compilado con Numba no da el resultado esperado. Se usa la regex.")
+        return None
+    return normalize_ascii
+
+
 def normalize_text(text: Optional[str], remove_accents: bool = True, lowercase: bool = True) -> Optional[str]:
     """
     Normaliza una cadena de texto para facilitar comparaciones o búsquedas.
@@ -46,20 +126,40 @@ def normalize_text(text: Optional[str], remove_accents: bool = True, lowercase:
         logger.warning(f"Se esperaba texto (str) para normalizar, pero se recibió {type(text)}. Devolviendo sin cambios.")
         return text
 
+    # Los textos cortos (ubicaciones, títulos...) se repiten muchísimo entre ofertas:
+    # los servimos desde caché. Las descripciones largas no, para no llenar la memoria.
+    if len(text) <= _CACHE_MAX_LEN:
+        return _normalize_text_cached(text, remove_accents, lowercase)
+    return _normalize_text_impl(text, remove_accents, lowercase)
+
+
+def _normalize_text_impl(text: str, remove_accents: bool, lowercase: bool) -> Optional[str]:
+    """El trabajo real de normalize_text, ya con 'text' validado como str."""
     try:
+        # Atajo: texto ASCII largo con Numba disponible. Quitar acentos no cambia
+        # nada en ASCII, así que basta con los pasos 1 a 3.
+        if len(text) >= _NUMBA_MIN_LEN and text.isascii():
+            normalize_ascii = _get_normalize_ascii()
+            if normalize_ascii is not None:
+                normalized = normalize_ascii(text, lowercase)
+                return normalized if normalized else None
+
         # 1. y 2. Limpieza básica de espacios en blanco.
-        normalized = re.sub(r'\s+', ' ', text).strip()
+        normalized = _WS_RE.sub(' ', text).strip()
 
         # 3. Convertir a minúsculas (si se indica).
         if lowercase:
             normalized = normalized.lower()
 
         # 4. Quitar acentos/diacríticos (si se indica).
-        #    Este es un método común y bastante efectivo en Python.
-        #    NFKD descompone caracteres con acentos (ej: 'á' -> 'a' + '´').
-        #    Luego codificamos a ASCII ignorando los caracteres no ASCII (los acentos '´').
-        #    Finalmente, decodificamos de vuelta a utf-8.
+        #    Primero la tabla precalculada, que resuelve el español y casi todo el latín.
+        #    Si aún quedan caracteres no ASCII (otros alfabetos, ligaduras, acentos sueltos),
+        #    usamos el método general: NFKD descompone caracteres con acentos
+        #    (ej: 'á' -> 'a' + '´'), luego codificamos a ASCII ignorando los caracteres
+        #    no ASCII (los acentos '´') y decodificamos de vuelta a utf-8.
         if remove_accents:
+            normalized = normalized.translate(_ACCENT_TABLE)
+        if remove_accents and not normalized.isascii():
             # Normalización a NFKD (Normalization Form Compatibility Decomposition)
             nfkd_form = unicodedata.normalize('NFKD', normalized)
             # Codificar a ASCII ignorando caracteres no mapeables (los diacríticos)
@@ -73,6 +173,13 @@ def normalize_text(text: Optional[str], remove_accents: bool = True, lowercase:
          logger.error(f"Error al normalizar texto: '{str(text)[:100]}...'. Error: {e}", exc_info=True)
          return text # Devolver el texto original si falla la normalización
 
+# Mismo resultado que _normalize_text_impl (es una función pura), memorizado por argumentos.
+_normalize_text_cached = functools.lru_cache(maxsize=1 << 16)(_normalize_text_impl)
+
+
+# URL absoluta = esquema (http, https, ftp...) seguido de '://'. Compilada una sola vez.
+_SCHEME_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*://')
+
 
 def safe_url_join(base_url: Optional[str], relative_path: Optional[str]) -> Optional[str]:
     """
@@ -103,7 +210,7 @@ def safe_url_join(base_url: Optional[str], relative_path: Optional[str]) -> Opti
         joined_url = urljoin(base_url, relative_path)
         # Una verificación simple por si acaso urljoin devuelve algo inesperado
         # Aceptar cualquier esquema válido (http, https, ftp, etc.)
-        if not isinstance(joined_url, str) or not re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*://', joined_url):
+        if not isinstance(joined_url, str) or not _SCHEME_RE.match(joined_url):
              logger.warning(f"urljoin devolvió un resultado inesperado o no absoluto: '{joined_url}' desde base '{base_url}' y path '{relative_path}'")
              return None
         return joined_url
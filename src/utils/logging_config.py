@@ -67,23 +67,18 @@ def setup_logging():
         project_root_dir = Path('.') # Default al directorio actual
 
         if config_loader: # Solo si pudimos importar el config_loader
-            config = config_loader.get_config()
-            if config:
-                # Obtenemos las preferencias de logging desde el diccionario de config
-                logging_settings = config.get('logging', {})
-                log_level_str = logging_settings.get('level', 'INFO').upper()
-                log_filename = logging_settings.get('log_file', 'app.log')
-                # Podríamos hacer configurable la carpeta de logs también
-                # log_dir_path_str = config.get('logging',{}).get('log_directory', 'logs')
-
-                # Obtenemos la raíz del proyecto desde config_loader si está disponible
-                if hasattr(config_loader, 'PROJECT_ROOT'):
-                    project_root_dir = config_loader.PROJECT_ROOT
-                else:
-                    print("WARNING: config_loader no tiene PROJECT_ROOT definido. Usando directorio actual para logs.")
-
+            # Solo necesitamos la sección 'logging': no hace falta cargar toda la config aún
+            logging_settings = config_loader.get_config_section('logging', {}) or {}
+            log_level_str = logging_settings.get('level', 'INFO').upper()
+            log_filename = logging_settings.get('log_file', 'app.log')
+            # Podríamos hacer configurable la carpeta de logs también
+            # log_dir_path_str = logging_settings.get('log_directory', 'logs')
+
+            # Obtenemos la raíz del proyecto desde config_loader si está disponible
+            if hasattr(config_loader, 'PROJECT_ROOT'):
+                project_root_dir = config_loader.PROJECT_ROOT
             else:
-                print("WARNING: config_loader.get_config() devolvió None. Usando configuración de logging por defecto.")
+                print("WARNING: config_loader no tiene PROJECT_ROOT definido. Usando directorio actual para logs.")
         else:
              print("WARNING: config_loader no disponible. Usando configuración de logging por defecto.")
 
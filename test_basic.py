@@ -1,90 +1,122 @@
 # test_basic.py
 import sys
 import json
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Asegurar que podamos importar desde el directorio raíz
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# La salida se acumula en memoria y se escribe de una vez al final de cada
+# paso, en lugar de una escritura a stdout por línea.
+_out = []
+
+def _p(*args):
+    """Acumula una línea de salida (se escribe con _flush())."""
+    _out.append(" ".join(map(str, args)))
+
+def _flush():
+    """Escribe a stdout todas las líneas acumuladas."""
+    if _out:
+        sys.stdout.write("\n".join(_out) + "\n")
+        _out.clear()
+    sys.stdout.flush()
 
 def print_separator():
-    print("\n" + "=" * 50)
+    _p("\n" + "=" * 50)
+
+def _fail(msg, exc):
+    """Imprime el error de un paso y su traceback."""
+    _p(f"✗ {msg}: {exc}")
+    _flush()
+    traceback.print_exc()
+
+def _probe(module_name):
+    """Intenta importar un módulo y devuelve (nombre, disponible)."""
+    try:
+        __import__(module_name)
+        return module_name, True
+    except ImportError:
+        return module_name, False
 
 def run_test():
     print_separator()
-    print("TEST BÁSICO DEL BUSCADOR DE EMPLEO")
+    _p("TEST BÁSICO DEL BUSCADOR DE EMPLEO")
     print_separator()
     
     # 1. Prueba de importación de módulos básicos
-    print("\n1. Importando módulos básicos...")
+    _p("\n1. Importando módulos básicos...")
     try:
         from src.utils import config_loader
-        print("✓ config_loader importado correctamente")
+        _p("✓ config_loader importado correctamente")
         
         from src.utils import logging_config
-        print("✓ logging_config importado correctamente")
+        _p("✓ logging_config importado correctamente")
         
         from src.utils.http_client import HTTPClient
-        print("✓ HTTPClient importado correctamente")
+        _p("✓ HTTPClient importado correctamente")
         
         from src.persistence.database_manager import DatabaseManager
-        print("✓ DatabaseManager importado correctamente")
+        _p("✓ DatabaseManager importado correctamente")
         
         from src.core.job_filter import JobFilter
-        print("✓ JobFilter importado correctamente")
+        _p("✓ JobFilter importado correctamente")
     except Exception as e:
-        print(f"✗ Error importando módulos: {e}")
-        import traceback
-        traceback.print_exc()
+        _fail("Error importando módulos", e)
         return
     
+    _flush()
+    
     # 2. Prueba de carga de configuración
-    print("\n2. Cargando configuración...")
+    _p("\n2. Cargando configuración...")
     try:
         config = {}
         # Intentar cargar la configuración de algunas formas
         try:
             config = config_loader.load_settings()
-            print("✓ Configuración cargada con load_settings()")
+            _p("✓ Configuración cargada con load_settings()")
         except:
             # Si no existe load_settings, probamos get_config
             try:
                 config = config_loader.get_config()
-                print("✓ Configuración cargada con get_config()")
+                _p("✓ Configuración cargada con get_config()")
             except:
                 # Si no hay método disponible, leer el archivo manualmente
                 import yaml
                 with open('config/settings.yaml', 'r', encoding='utf-8') as f:
                     config = yaml.safe_load(f)
-                print("✓ Configuración cargada leyendo el archivo YAML directamente")
+                _p("✓ Configuración cargada leyendo el archivo YAML directamente")
         
         # Verificar si hay datos en la configuración
         if config:
-            print(f"✓ Configuración contiene datos: {len(config)} secciones principales")
+            _p(f"✓ Configuración contiene datos: {len(config)} secciones principales")
         else:
-            print("✗ La configuración está vacía")
+            _p("✗ La configuración está vacía")
     except Exception as e:
-        print(f"✗ Error cargando configuración: {e}")
-        import traceback
-        traceback.print_exc()
+        _fail("Error cargando configuración", e)
         return
     
+    _flush()
+    
     # 3. Prueba de conexión HTTP básica
-    print("\n3. Probando conexión HTTP...")
+    _p("\n3. Probando conexión HTTP...")
     try:
         http_client = HTTPClient()
         response = http_client.get("https://www.google.com")
         if response and response.status_code == 200:
-            print(f"✓ Conexión HTTP exitosa: status_code={response.status_code}")
+            _p(f"✓ Conexión HTTP exitosa: status_code={response.status_code}")
         else:
-            print(f"✗ Conexión HTTP fallida: {response}")
+            _p(f"✗ Conexión HTTP fallida: {response}")
     except Exception as e:
-        print(f"✗ Error probando conexión HTTP: {e}")
-        import traceback
-        traceback.print_exc()
+        _fail("Error probando conexión HTTP", e)
+    
+    _flush()
     
     # 4. Verificar fuentes disponibles
-    print("\n4. Verificando fuentes disponibles...")
+    _p("\n4. Verificando fuentes disponibles...")
     try:
         # Verificar APIs
         from src.apis.base_api import BaseAPIClient
@@ -96,13 +128,6 @@ def run_test():
             "remoteok_client"
         ]
         
-        for api_name in apis:
-            try:
-                __import__(f"src.apis.{api_name}")
-                print(f"✓ API {api_name} disponible")
-            except ImportError:
-                print(f"✗ API {api_name} no disponible")
-        
         # Verificar scrapers
         from src.scrapers.base_scraper import BaseScraper
         scrapers = [
@@ -114,20 +139,30 @@ def run_test():
             "computrabajo_scraper_improved"
         ]
         
+        # Probamos todas las importaciones a la vez: la lectura de archivos y
+        # bytecode de cada módulo se solapa entre hilos.
+        all_modules = [f"src.apis.{n}" for n in apis] + [f"src.scrapers.{n}" for n in scrapers]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            availability = dict(executor.map(_probe, all_modules))
+        
+        for api_name in apis:
+            if availability[f"src.apis.{api_name}"]:
+                _p(f"✓ API {api_name} disponible")
+            else:
+                _p(f"✗ API {api_name} no disponible")
+        
         for scraper_name in scrapers:
-            try:
-                __import__(f"src.scrapers.{scraper_name}")
-                print(f"✓ Scraper {scraper_name} disponible")
-            except ImportError:
-                print(f"✗ Scraper {scraper_name} no disponible")
+            if availability[f"src.scrapers.{scraper_name}"]:
+                _p(f"✓ Scraper {scraper_name} disponible")
+            else:
+                _p(f"✗ Scraper {scraper_name} no disponible")
     except Exception as e:
-        print(f"✗ Error verificando fuentes: {e}")
-        import traceback
-        traceback.print_exc()
+        _fail("Error verificando fuentes", e)
     
     print_separator()
-    print("PRUEBA BÁSICA COMPLETADA")
+    _p("PRUEBA BÁSICA COMPLETADA")
     print_separator()
+    _flush()
 
 if __name__ == "__main__":
     run_test()
@@ -25,18 +25,26 @@ modules = [
 ]
 
 print("Intentando importar módulos principales...\n")
+sys.stdout.flush()
 
-for module in modules:
-    try:
-        __import__(module)
-        print(f"✅ {module}: Importado correctamente")
-    except ImportError as e:
-        print(f"❌ {module}: Error de importación - {e}")
-    except SyntaxError as e:
-        print(f"❌ {module}: Error de sintaxis - {e}")
-        print(f"   En archivo: {e.filename}, línea {e.lineno}")
-        print(f"   Mensaje: {e.msg}")
-    except Exception as e:
-        print(f"❌ {module}: Error inesperado - {e}")
+# Acumulamos los resultados y los escribimos de una vez; el finally garantiza
+# que se muestren aunque algún módulo termine el proceso con sys.exit().
+_out = []
+try:
+    for module in modules:
+        try:
+            __import__(module)
+            _out.append(f"✅ {module}: Importado correctamente")
+        except ImportError as e:
+            _out.append(f"❌ {module}: Error de importación - {e}")
+        except SyntaxError as e:
+            _out.append(f"❌ {module}: Error de sintaxis - {e}")
+            _out.append(f"   En archivo: {e.filename}, línea {e.lineno}")
+            _out.append(f"   Mensaje: {e.msg}")
+        except Exception as e:
+            _out.append(f"❌ {module}: Error inesperado - {e}")
+finally:
+    if _out:
+        sys.stdout.write("\n".join(_out) + "\n")
 
 print("\nFinalizado diagnóstico básico de importación")
@@ -12,13 +12,25 @@ import os
 import sys
 import time
 import json
+from time import perf_counter as _pc
 import importlib.util
 from datetime import datetime
 from pathlib import Path
 
+# orjson es opcional: si está instalado serializamos los resultados con él,
+# si no, usamos el módulo json estándar.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Asegurar que podamos importar desde el directorio raíz
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Directorio donde los pipelines guardan el histórico de CSV
+csv_dir = project_root / "data" / "historico"
 
 def check_module_exists(module_path):
     """Verifica si un módulo existe en el sistema."""
@@ -29,6 +41,17 @@ def check_module_exists(module_path):
     except ImportError:
         return False
 
+def _dumps(obj):
+    """Serializa a bytes UTF-8 compactos usando orjson si está disponible."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+def _append_record(path, record):
+    """Añade un registro como una línea JSON (JSONL) al archivo de resultados."""
+    with open(path, 'ab') as f:
+        f.write(_dumps(record) + b"\n")
+
 def print_header(text):
     """Imprime un encabezado formateado."""
     print("\n" + "=" * 80)
@@ -41,16 +64,61 @@ def print_section(text):
     print(f" {text} ".center(80, "-"))
     print("-" * 80)
 
+def _scan(path):
+    """Lee el archivo una sola vez por bloques y devuelve (bytes, líneas)."""
+    size = 0
+    lines = 0
+    last = b""
+    with open(path, 'rb', buffering=0) as f:
+        while (buf := f.read(1 << 20)):
+            size += len(buf)
+            lines += buf.count(b'\n')
+            last = buf[-1:]
+    # Una última línea sin salto final también cuenta
+    if last and last != b'\n':
+        lines += 1
+    return size, lines
+
+def get_latest_csv_stats(prefix):
+    """Devuelve estadísticas básicas del CSV más reciente que comienza con el prefijo."""
+    # Un solo recorrido con scandir: el stat de cada entrada nos da el mtime
+    # sin volver a consultar el disco por cada archivo.
+    latest_path, latest_mtime = None, None
+    try:
+        with os.scandir(csv_dir) as entries:
+            for entry in entries:
+                if not (entry.is_file() and entry.name.startswith(prefix) and entry.name.endswith(".csv")):
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_path, latest_mtime = Path(entry.path), mtime
+    except FileNotFoundError:
+        pass
+    if latest_path is None:
+        return {"error": f"No se encontraron archivos {prefix}*.csv"}
+    
+    # Obtener estadísticas básicas (tamaño y líneas en una sola lectura)
+    file_size, line_count = _scan(latest_path)
+    
+    return {
+        "filename": latest_path.name,
+        "size_bytes": file_size,
+        "line_count": line_count,
+        "last_modified": datetime.fromtimestamp(latest_mtime).isoformat()
+    }
+
 def run_test():
+    # Tomamos la hora una sola vez y la reutilizamos en todo el test
+    now = time.localtime()
     print_header("TEST DE MEJORAS PARA EL BUSCADOR DE EMPLEO INTELIGENTE")
-    print(f"Fecha de ejecución: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Fecha de ejecución: {time.strftime('%Y-%m-%d %H:%M:%S', now)}")
     
     # Crear directorio para resultados de prueba si no existe
     results_dir = project_root / "test_results"
     results_dir.mkdir(exist_ok=True)
     
     # Timestamp para los archivos de resultados
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", now)
     
     # Verificar disponibilidad de módulos mejorados
     print_section("VERIFICACIÓN DE MÓDULOS MEJORADOS")
@@ -74,20 +142,33 @@ def run_test():
     
     print_section("EJECUCIÓN DE PIPELINES")
     
-    # Preparar registro de resultados
+    # Preparar registro de resultados. Cada fase se escribe en el JSONL en cuanto
+    # termina, así los resultados parciales sobreviven si algo falla más adelante.
+    results_file = results_dir / f"test_results_{timestamp}.jsonl"
     test_results = {
-        "fecha": datetime.now().isoformat(),
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S", now),
         "modulos_disponibles": modules_available,
         "pipelines": {}
     }
+    _append_record(results_file, {
+        "phase": "inicio",
+        "fecha": test_results["fecha"],
+        "modulos_disponibles": modules_available
+    })
     
     # Ejecutar pipeline original
     print("\n1. Ejecutando pipeline original...")
-    start_original = time.time()
+    original_result, original_error = None, None
+    start_original = _pc()
     try:
         from src.main import run_job_search_pipeline as original_pipeline
         original_result = original_pipeline()
-        time_original = time.time() - start_original
+    except Exception as e:
+        original_error = e
+    finally:
+        time_original = _pc() - start_original
+    
+    if original_error is None:
         print(f"   ✅ Completado en {time_original:.2f} segundos.")
         
         if isinstance(original_result, dict):
@@ -107,24 +188,32 @@ def run_test():
                 "exito": True,
                 "mensaje": "Resultado con formato inesperado"
             }
-    except Exception as e:
-        print(f"   ❌ Error ejecutando pipeline original: {str(e)}")
+    else:
+        print(f"   ❌ Error ejecutando pipeline original: {str(original_error)}")
         test_results["pipelines"]["original"] = {
-            "tiempo": time.time() - start_original,
+            "tiempo": time_original,
             "exito": False,
-            "error": str(e)
+            "error": str(original_error)
         }
     
+    _append_record(results_file, {"phase": "original", **test_results["pipelines"]["original"]})
+    
     # Breve pausa para asegurar que los recursos se liberan
     time.sleep(2)
     
     # Ejecutar pipeline mejorado
     print("\n2. Ejecutando pipeline mejorado...")
-    start_improved = time.time()
+    improved_result, improved_error = None, None
+    start_improved = _pc()
     try:
         from src.main_improved import run_job_search_pipeline as improved_pipeline
         improved_result = improved_pipeline()
-        time_improved = time.time() - start_improved
+    except Exception as e:
+        improved_error = e
+    finally:
+        time_improved = _pc() - start_improved
+    
+    if improved_error is None:
         print(f"   ✅ Completado en {time_improved:.2f} segundos.")
         
         if isinstance(improved_result, dict):
@@ -144,25 +233,33 @@ def run_test():
                 "exito": True,
                 "mensaje": "Resultado con formato inesperado"
             }
-    except Exception as e:
-        print(f"   ❌ Error ejecutando pipeline mejorado: {str(e)}")
+    else:
+        print(f"   ❌ Error ejecutando pipeline mejorado: {str(improved_error)}")
         test_results["pipelines"]["mejorado"] = {
-            "tiempo": time.time() - start_improved,
+            "tiempo": time_improved,
             "exito": False,
-            "error": str(e)
+            "error": str(improved_error)
         }
     
+    _append_record(results_file, {"phase": "mejorado", **test_results["pipelines"]["mejorado"]})
+    
     # Breve pausa para asegurar que los recursos se liberan
     time.sleep(2)
     
     # Ejecutar super pipeline si está disponible
     if modules_available.get('src.super_pipeline', False):
         print("\n3. Ejecutando super pipeline...")
-        start_super = time.time()
+        super_result, super_error = None, None
+        start_super = _pc()
         try:
             from src.super_pipeline import run_job_search_pipeline_super as super_pipeline
             super_result = super_pipeline()
-            time_super = time.time() - start_super
+        except Exception as e:
+            super_error = e
+        finally:
+            time_super = _pc() - start_super
+        
+        if super_error is None:
             print(f"   ✅ Completado en {time_super:.2f} segundos.")
             
             if isinstance(super_result, dict):
@@ -182,20 +279,24 @@ def run_test():
                     "exito": True,
                     "mensaje": "Resultado con formato inesperado"
                 }
-        except Exception as e:
-            print(f"   ❌ Error ejecutando super pipeline: {str(e)}")
+        else:
+            print(f"   ❌ Error ejecutando super pipeline: {str(super_error)}")
             test_results["pipelines"]["super"] = {
-                "tiempo": time.time() - start_super,
+                "tiempo": time_super,
                 "exito": False,
-                "error": str(e)
+                "error": str(super_error)
             }
+        
+        _append_record(results_file, {"phase": "super", **test_results["pipelines"]["super"]})
     else:
         print("\n3. Super pipeline no disponible, saltando prueba.")
     
-    # Guardar resultados en JSON
-    results_file = results_dir / f"test_results_{timestamp}.json"
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump(test_results, f, indent=2, ensure_ascii=False)
+    # Estadísticas de los CSV que dejaron los pipelines en el histórico
+    _append_record(results_file, {
+        "phase": "csv",
+        "ofertas_todas": get_latest_csv_stats("ofertas_todas_"),
+        "ofertas_filtradas": get_latest_csv_stats("ofertas_filtradas_")
+    })
     
     print(f"\nResultados guardados en: {results_file}")
     
@@ -217,74 +318,5 @@ def run_test():
     
     print_header("FIN DEL TEST")
 
-if __name__ == "__main__":
-    run_test()
-    
-    # Extraer estadísticas de los archivos CSV
-    csv_dir = project_root / "data" / "historico"
-    
-    def get_latest_csv_stats(prefix):
-        # Obtener el CSV más reciente que comienza con el prefijo
-        files = list(csv_dir.glob(f"{prefix}*.csv"))
-        if not files:
-            return {"error": f"No se encontraron archivos {prefix}*.csv"}
-        
-        latest_file = max(files, key=os.path.getmtime)
-        
-        # Obtener estadísticas básicas
-        line_count = sum(1 for _ in open(latest_file, 'r', encoding='utf-8'))
-        file_size = os.path.getsize(latest_file)
-        
-        return {
-            "filename": latest_file.name,
-            "size_bytes": file_size,
-            "line_count": line_count,
-            "last_modified": datetime.fromtimestamp(os.path.getmtime(latest_file)).isoformat()
-        }
-    
-    original_stats = {
-        "tiempo_ejecucion": time_original,
-        "ofertas_todas": get_latest_csv_stats("ofertas_"),
-        "ofertas_filtradas": get_latest_csv_stats("ofertas_filtradas_")
-    }
-    
-    improved_stats = {
-        "tiempo_ejecucion": time_improved,
-        "ofertas_todas": get_latest_csv_stats("ofertas_"),
-        "ofertas_filtradas": get_latest_csv_stats("ofertas_filtradas_"),
-        "pipeline_summary": improved_result.get("summary", {})
-    }
-    
-    # Guardar resultados
-    results = {
-        "timestamp": timestamp,
-        "original": original_stats,
-        "improved": improved_stats
-    }
-    
-    results_file = results_dir / f"comparacion_mejoras_{timestamp}.json"
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
-    
-    # Mostrar comparación
-    print("\n" + "=" * 70)
-    print("RESULTADOS DE LA COMPARACIÓN")
-    print("=" * 70)
-    
-    original_lines = original_stats["ofertas_filtradas"].get("line_count", 0)
-    improved_lines = improved_stats["ofertas_filtradas"].get("line_count", 0)
-    
-    if original_lines and improved_lines:
-        improvement = ((improved_lines - original_lines) / original_lines) * 100
-        print(f"\nOfertas filtradas (original): {original_lines - 1} registros")  # -1 por la cabecera
-        print(f"Ofertas filtradas (mejorado): {improved_lines - 1} registros")  # -1 por la cabecera
-        print(f"Mejora: {improvement:.1f}% más ofertas relevantes")
-    
-    print(f"\nTiempo de ejecución (original): {time_original:.2f} segundos")
-    print(f"Tiempo de ejecución (mejorado): {time_improved:.2f} segundos")
-    
-    print(f"\nDetalles completos guardados en: {results_file}")
-    print("=" * 70)
-
 if __name__ == "__main__":
     run_test()
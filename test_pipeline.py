@@ -3,10 +3,12 @@ import sys
 from pathlib import Path
 import time
 import json
+import traceback
 
 # Asegurar que podamos importar desde el directorio raíz
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def run_test():
     print("=" * 70)
@@ -56,7 +58,6 @@ def run_test():
         
     except Exception as e:
         print(f"\nERROR en la ejecución del pipeline: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
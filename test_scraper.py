@@ -1,10 +1,12 @@
 # test_scraper.py
 import sys
+import traceback
 from pathlib import Path
 
 # Asegurar que podamos importar desde el directorio raíz
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 try:
     print("Importando HTTPClient...")
@@ -36,7 +38,6 @@ try:
     print("\nBúsqueda completada con éxito")
 except Exception as e:
     print(f"ERROR: {str(e)}")
-    import traceback
     traceback.print_exc()
 finally:
     # Asegurar que cerramos el cliente HTTP
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# /tests/conftest.py
+
+"""
+Configuración compartida de pytest.
+
+pytest carga este archivo antes de recolectar las pruebas, así que aquí
+añadimos UNA sola vez la raíz del proyecto al sys.path para que todos
+los módulos de prueba puedan hacer 'from src...' sin repetirlo cada uno.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = str(Path(__file__).resolve().parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+@pytest.fixture(autouse=True)
+def _no_config_disk_cache(monkeypatch, tmp_path):
+    """
+    Las pruebas no usan la caché en disco de settings.yaml (config_loader): así
+    no dejan archivos en la caché del usuario ni dependen de lo que haya allí.
+    Las que prueban la caché la reactivan, y escribe dentro de tmp_path.
+    """
+    monkeypatch.setenv("CONFIG_CACHE_DISABLE", "1")
+    monkeypatch.setenv("CONFIG_CACHE_DIR", str(tmp_path / "config_cache"))
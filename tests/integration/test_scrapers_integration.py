@@ -17,39 +17,20 @@ la descarga de HTML leyendo archivos locales de la carpeta /tests/fixtures/.
 """
 
 import pytest
-import sys
+import functools
+import importlib
+import re
 from pathlib import Path
 import logging
 from typing import Dict, Optional
 
-# Añadir raíz para imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 # Importar lo necesario
 try:
     from src.utils.http_client import HTTPClient
     from src.utils import config_loader # Aunque no lo usemos directo, los scrapers sí
     from src.utils import logging_config
-
-    # --- ¡Importar TODAS las clases de Scraper que queremos probar! ---
-    from src.scrapers.base_scraper import BaseScraper # Importante para type hints/checks
-    from src.scrapers.computrabajo_scraper import ComputrabajoScraper
-    from src.scrapers.infojobs_scraper import InfojobsScraper
-    from src.scrapers.multitrabajos_scraper import MultitrabajosScraper
-    from src.scrapers.porfinempleo_scraper import PorfinempleoScraper
-    from src.scrapers.tecnoempleo_scraper import TecnoempleoScraper
-    from src.scrapers.empleosnet_scraper import EmpleosNetScraper
-    from src.scrapers.portalempleoec_scraper import PortalempleoecScraper
-    from src.scrapers.bumeran_scraper import BumeranScraper
-    from src.scrapers.getonboard_scraper import GetonboardScraper
-    from src.scrapers.remoterocketship_scraper import RemoteRocketshipScraper
-    from src.scrapers.workana_scraper import WorkanaScraper
-    from src.scrapers.soyfreelancer_scraper import SoyFreelancerScraper
-    # ... añadir futuros scrapers aquí ...
-
 except ImportError as e:
-     pytest.exit(f"Error importando módulos/clases scraper para pruebas: {e}", returncode=1)
+     pytest.exit(f"Error importando módulos necesarios para pruebas: {e}", returncode=1)
 
 # Configurar logging básico para ver mensajes de las pruebas
 # logging_config.setup_logging() # Podríamos configurar el logging real
@@ -58,6 +39,32 @@ logger = logging.getLogger(__name__)
 
 # --- Constantes y Fixtures ---
 
+# Clases de scraper por nombre de fuente: (módulo, clase). No las importamos todas
+# al cargar el archivo; cada test importa solo la suya (útil con -k).
+# --- ¡Añadir aquí futuros scrapers! ---
+SCRAPER_CLASSES = {
+    "computrabajo": ("src.scrapers.computrabajo_scraper", "ComputrabajoScraper"),
+    "infojobs": ("src.scrapers.infojobs_scraper", "InfojobsScraper"),
+    "multitrabajos": ("src.scrapers.multitrabajos_scraper", "MultitrabajosScraper"),
+    "porfinempleo": ("src.scrapers.porfinempleo_scraper", "PorfinempleoScraper"),
+    "tecnoempleo": ("src.scrapers.tecnoempleo_scraper", "TecnoempleoScraper"),
+    "empleosnet": ("src.scrapers.empleosnet_scraper", "EmpleosNetScraper"),
+    "portalempleoec": ("src.scrapers.portalempleoec_scraper", "PortalempleoecScraper"),
+    "bumeran": ("src.scrapers.bumeran_scraper", "BumeranScraper"),
+    "getonboard": ("src.scrapers.getonboard_scraper", "GetonboardScraper"),
+    "remoterocketship": ("src.scrapers.remoterocketship_scraper", "RemoteRocketshipScraper"),
+    "workana": ("src.scrapers.workana_scraper", "WorkanaScraper"),
+    "soyfreelancer": ("src.scrapers.soyfreelancer_scraper", "SoyFreelancerScraper"),
+}
+
+def _get_scraper_cls(source_name: str):
+    """Importa (solo cuando se necesita) y devuelve la clase de scraper de una fuente."""
+    module_name, class_name = SCRAPER_CLASSES[source_name]
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        pytest.fail(f"Error importando {module_name}.{class_name} para pruebas: {e}")
+
 # Directorio donde guardaremos/leeremos los HTML de prueba.
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 # ¡Asegúrate de que esta carpeta exista y contenga los HTML!
@@ -76,8 +83,7 @@ def http_client():
 @pytest.fixture(scope="module")
 def app_config():
     try:
-        # Forzamos recarga por si acaso
-        config_loader._config = None # Resetear config cacheada si la hubiera
+        # get_config() está memoizada: si otro módulo ya la cargó, no se relee el YAML
         config = config_loader.get_config()
         if not config:
              pytest.fail("No se pudo cargar la configuración necesaria para las pruebas.")
@@ -85,9 +91,22 @@ def app_config():
     except Exception as e:
         pytest.fail(f"Fallo al cargar configuración en fixture: {e}")
 
+# Config de cada scraper por nombre de fuente, sacada una sola vez del árbol de config
+@pytest.fixture(scope="module")
+def scraper_configs(app_config) -> Dict[str, Dict]:
+    return app_config.get('sources', {}).get('scrapers', {}) or {}
+
 
 # --- Función Genérica para Simular _fetch_html ---
 
+class _MissingFixture(AssertionError):
+    """Falta un HTML de fixture. Es un AssertionError: pytest lo reporta como fallo del test."""
+
+@functools.lru_cache(maxsize=128)
+def _load_fixture(path_str: str) -> str:
+    """Lee (una sola vez) el HTML de un fixture; las siguientes lecturas salen de memoria."""
+    return Path(path_str).read_text(encoding='utf-8')
+
 def create_mock_fetch_html(fixture_map: Dict[str, str]):
     """
     Crea una función mock para _fetch_html que lee archivos locales.
@@ -100,31 +119,42 @@ def create_mock_fetch_html(fixture_map: Dict[str, str]):
     Returns:
         Callable: La función mock para usar con monkeypatch.
     """
-    def mock_fetch(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
+    # Comprobamos UNA vez, al crear el mock, que existan todos los fixtures del mapa:
+    # los archivos no aparecen ni desaparecen durante el test, así que mock_fetch
+    # ya no necesita un stat por cada descarga simulada.
+    missing = sorted({f for f in fixture_map.values() if not (FIXTURES_DIR / f).is_file()})
+    if missing:
+        logger.error(f"MOCK FETCH: ¡Fixture files no encontrados en {FIXTURES_DIR}!: {missing}")
+        # ¡Fallar la prueba si el fixture no existe es importante!
+        raise _MissingFixture(f"Fixture HTML no encontrado: {', '.join(str(FIXTURES_DIR / f) for f in missing)}. Debes crearlo.")
+
+    # Todas las claves en una sola regex (alternativa de literales escapados):
+    # la búsqueda de "¿qué clave aparece en la URL?" la hace el motor de regex en C.
+    # Sin claves no hay patrón (una regex vacía coincidiría con cualquier URL).
+    key_pattern = re.compile("|".join(map(re.escape, fixture_map))) if fixture_map else None
+
+    # Función normal (sin 'self'): se asigna tal cual como atributo de la instancia.
+    def mock_fetch(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
         logger.debug(f"MOCK FETCH: Solicitada URL: {url}")
-        # Buscamos qué fixture corresponde a esta URL
-        found_fixture = None
-        for url_key, filename in fixture_map.items():
-            # Hacemos una comprobación simple: si la clave está en la URL solicitada
-            if url_key in url:
-                found_fixture = filename
-                break # Encontramos el primero que coincida
+        # Buscamos qué fixture corresponde a esta URL (la primera clave que aparezca en ella)
+        match = key_pattern.search(url) if key_pattern else None
+        found_fixture = fixture_map[match.group()] if match else None
 
         if found_fixture:
+            url_key = match.group()
             fixture_path = FIXTURES_DIR / found_fixture
             logger.info(f"MOCK FETCH: URL '{url}' coincide con clave '{url_key}'. Leyendo fixture: {fixture_path}")
-            if fixture_path.is_file():
-                try:
-                    # Leemos el contenido del archivo HTML guardado
-                    return fixture_path.read_text(encoding='utf-8')
-                except Exception as e:
-                     logger.error(f"MOCK FETCH: Error leyendo fixture '{fixture_path}': {e}")
-                     return None # Devolver None si no se puede leer el fixture
-            else:
-                logger.error(f"MOCK FETCH: ¡Fixture file no encontrado! Ruta: {fixture_path}")
-                # ¡Fallar la prueba si el fixture no existe es importante!
+            try:
+                # Leemos el contenido del archivo HTML guardado (ya validado al crear el mock)
+                return _load_fixture(str(fixture_path))
+            except FileNotFoundError:
+                # Caso residual: el archivo desapareció después de validarlo al crear el mock.
+                # Aquí seguimos dentro de fetch_jobs, que atrapa 'Exception': pytest.fail
+                # (no hereda de Exception) es lo único que llega seguro hasta pytest.
                 pytest.fail(f"Fixture HTML no encontrado: {fixture_path}. Debes crearlo.")
-                return None
+            except Exception as e:
+                 logger.error(f"MOCK FETCH: Error leyendo fixture '{fixture_path}': {e}")
+                 return None # Devolver None si no se puede leer el fixture
         else:
             logger.warning(f"MOCK FETCH: URL no mapeada a ningún fixture: {url}")
             # Devolver None si la URL no coincide con ningún fixture conocido para este test
@@ -143,144 +173,80 @@ COMPUTRABAJO_FIXTURE_MAP = {
     # Añadir más mapeos si el scraper visita más páginas (ej: paginación)
 }
 
-def test_computrabajo_scraper_integration(http_client, monkeypatch, app_config):
-    """Prueba la integración del ComputrabajoScraper con HTML de fixture."""
-    logger.info("\n--- TEST: test_computrabajo_scraper_integration ---")
-    source_name = "computrabajo"
+# --- Ejemplo para Infojobs ---
+# ¡Necesitarás crear fixtures para Infojobs!
+INFOJOBS_FIXTURE_MAP = {
+    "list.xhtml?keyword=python+data&page=1": "infojobs_search_p1.html",
+     # No visitamos detalle en la versión actual de Infojobs scraper, así que no necesitamos fixtures de detalle.
+     # Si modificas el scraper para visitar detalles, necesitarás añadirlos aquí.
+}
+
+# Claves que TODA oferta estándar debe traer (además de titulo/url/fuente, que se piden no vacías)
+STANDARD_JOB_KEYS = ('empresa', 'ubicacion', 'fecha_publicacion')
+
+# Un caso por scraper: (nombre de fuente en settings.yaml y en SCRAPER_CLASSES,
+# mapa de fixtures, parámetros de búsqueda que generan las URLs mapeadas,
+# claves extra a verificar).
+# --- Añadir aquí un caso por CADA scraper nuevo ---
+# ej: ("multitrabajos", MULTITRABAJOS_FIXTURE_MAP, {...}, ()),
+SCRAPER_CASES = [
+    pytest.param(
+        "computrabajo", COMPUTRABAJO_FIXTURE_MAP,
+        {'keywords': ['python', 'datos'], 'location': 'Quito'}, # Asume que esto genera la URL mapeada arriba
+        ('descripcion',), # La descripción puede ser None si falla el detalle, pero la clave debe estar
+        id="computrabajo",
+    ),
+    pytest.param(
+        "infojobs", INFOJOBS_FIXTURE_MAP,
+        {'keywords': ['python', 'data'], 'location': 'Remote Spain'},
+        ('salario',), # Infojobs suele tener salario en la lista
+        id="infojobs",
+    ),
+]
+
+def _assert_standard_job_shape(first_job: Dict, source_name: str, extra_keys=()):
+    """Verifica que una oferta tenga el formato estándar que devuelven todos los scrapers."""
+    assert first_job.get('titulo'), "La oferta no tiene título."
+    assert first_job.get('url'), "La oferta no tiene URL."
+    assert first_job.get('fuente') == source_name
+    for key in STANDARD_JOB_KEYS + tuple(extra_keys):
+        assert key in first_job, f"Falta la clave '{key}' en la oferta."
+
+@pytest.mark.parametrize("source_name, fixture_map, search_params, extra_keys", SCRAPER_CASES)
+def test_scraper_integration(http_client, monkeypatch, scraper_configs,
+                             source_name, fixture_map, search_params, extra_keys):
+    """Prueba la integración de cada scraper con su HTML de fixture."""
+    logger.info(f"\n--- TEST: test_scraper_integration[{source_name}] ---")
     # Obtenemos la config específica (principalmente por base_url)
-    scraper_config = app_config.get('sources', {}).get('scrapers', {}).get(source_name, {})
+    scraper_config = scraper_configs.get(source_name, {})
     if not scraper_config.get('base_url'): pytest.skip(f"Configuración 'base_url' no encontrada para {source_name}")
 
     # 1. Creamos el scraper
-    scraper = ComputrabajoScraper(http_client=http_client, config=scraper_config)
+    scraper_cls = _get_scraper_cls(source_name)
+    scraper = scraper_cls(http_client=http_client, config=scraper_config)
 
     # 2. Creamos y aplicamos el mock para _fetch_html
-    mock_fetch = create_mock_fetch_html(COMPUTRABAJO_FIXTURE_MAP)
-    monkeypatch.setattr(scraper, '_fetch_html', mock_fetch.__get__(scraper, type(scraper)))
+    mock_fetch = create_mock_fetch_html(fixture_map)
+    monkeypatch.setattr(scraper, '_fetch_html', mock_fetch)
 
-    # 3. Definimos parámetros de búsqueda (deben coincidir con una clave en el fixture map si afecta la URL)
-    search_params = {'keywords': ['python', 'datos'], 'location': 'Quito'} # Asume que esto genera la URL mapeada arriba
-
-    # 4. Ejecutamos fetch_jobs (usará el mock para leer fixtures)
+    # 3. Ejecutamos fetch_jobs (usará el mock para leer fixtures)
     try:
         jobs = scraper.fetch_jobs(search_params)
     except Exception as e:
         pytest.fail(f"scraper.fetch_jobs lanzó una excepción inesperada: {e}")
 
-
-    # 5. Verificaciones (Asserts) - ¡Ajustar según el contenido de tus fixtures!
+    # 4. Verificaciones (Asserts) - ¡Ajustar según el contenido de tus fixtures!
     assert isinstance(jobs, list), "El resultado debería ser una lista."
     # Verificar que obtuvimos *algún* resultado (depende del fixture)
     assert len(jobs) > 0, "La lista de trabajos no debería estar vacía (revisa tu fixture y selectores)."
-    # Verificar que cada elemento sea un diccionario
     assert all(isinstance(job, dict) for job in jobs)
-    # Verificar que el primer trabajo tenga las claves estándar esperadas y valores no nulos
     first_job = jobs[0]
-    assert 'titulo' in first_job and first_job['titulo'] is not None
-    assert 'empresa' in first_job # Empresa puede ser None a veces? Verificar
-    assert 'url' in first_job and first_job['url'] is not None
-    assert 'fuente' in first_job and first_job['fuente'] == source_name
-    assert 'descripcion' in first_job # La descripción puede ser None si falla el detalle
-    assert 'fecha_publicacion' in first_job
-    assert 'ubicacion' in first_job
+    _assert_standard_job_shape(first_job, source_name, extra_keys)
 
     # Verificar un valor específico que SEPAS que está en tu fixture HTML
     # EJEMPLO (¡CAMBIAR ESTO!):
     # assert first_job['titulo'] == "Analista Programador Python (De Fixture)"
-    # assert "Quito" in first_job['ubicacion'] # O la ubicación esperada
-    logger.info(f"Primer trabajo parseado (Computrabajo): {first_job.get('titulo')} - {first_job.get('url')}")
+    logger.info(f"Primer trabajo parseado ({source_name}): {first_job.get('titulo')} - {first_job.get('url')}")
 
 
-# --- Ejemplo para Infojobs ---
-# ¡Necesitarás crear fixtures para Infojobs!
-INFOJOBS_FIXTURE_MAP = {
-    "list.xhtml?keyword=python+data&page=1": "infojobs_search_p1.html",
-     # No visitamos detalle en la versión actual de Infojobs scraper, así que no necesitamos fixtures de detalle.
-     # Si modificas el scraper para visitar detalles, necesitarás añadirlos aquí.
-}
-def test_infojobs_scraper_integration(http_client, monkeypatch, app_config):
-    """Prueba la integración del InfojobsScraper con HTML de fixture."""
-    logger.info("\n--- TEST: test_infojobs_scraper_integration ---")
-    source_name = "infojobs"
-    scraper_config = app_config.get('sources', {}).get('scrapers', {}).get(source_name, {})
-    if not scraper_config.get('base_url'): pytest.skip(f"Configuración 'base_url' no encontrada para {source_name}")
-
-    scraper = InfojobsScraper(http_client=http_client, config=scraper_config)
-    mock_fetch = create_mock_fetch_html(INFOJOBS_FIXTURE_MAP)
-    monkeypatch.setattr(scraper, '_fetch_html', mock_fetch.__get__(scraper, type(scraper)))
-    search_params = {'keywords': ['python', 'data'], 'location': 'Remote Spain'} # Usar params que generen URL mapeada
-
-    try:
-        jobs = scraper.fetch_jobs(search_params)
-    except Exception as e:
-         pytest.fail(f"scraper.fetch_jobs lanzó una excepción inesperada: {e}")
-
-
-    assert isinstance(jobs, list)
-    assert len(jobs) > 0 # Asumiendo que infojobs_search_p1.html tiene ofertas
-    assert all(isinstance(job, dict) for job in jobs)
-    first_job = jobs[0]
-    assert 'titulo' in first_job and first_job['titulo']
-    assert 'url' in first_job and first_job['url']
-    assert 'fuente' in first_job and first_job['fuente'] == source_name
-    # Verificar otras claves esperadas de Infojobs (empresa, ubicacion, fecha, salario?)
-    assert 'empresa' in first_job
-    assert 'ubicacion' in first_job
-    assert 'fecha_publicacion' in first_job
-    assert 'salario' in first_job # Infojobs suele tener salario en la lista
-
-    # EJEMPLO de assert específico (¡CAMBIAR según tu fixture!):
-    # assert "€" in first_job['salario'] # Verificar que el salario parece correcto
-    logger.info(f"Primer trabajo parseado (Infojobs): {first_job.get('titulo')} - {first_job.get('url')}")
-
-
-# --- Añadir funciones de test similares para CADA scraper ---
-# ej: test_multitrabajos_scraper_integration(...)
-#     test_porfinempleo_scraper_integration(...)
-#     test_tecnoempleo_scraper_integration(...)
-#     test_empleosnet_scraper_integration(...)
-#     test_portalempleoec_scraper_integration(...)
-#     test_bumeran_scraper_integration(...)
-#     test_getonboard_scraper_integration(...)
-#     test_remoterocketship_scraper_integration(...)
-#     test_workana_scraper_integration(...)
-#     test_soyfreelancer_scraper_integration(...)
-
-# --- Ejemplo Vacío para Otro Scraper (Copia y Adapta) ---
-# ¡Necesitarás crear fixtures para este scraper!
-# OTRAFUENTE_FIXTURE_MAP = {
-#     "url_clave_1": "otrafuente_search_p1.html",
-#     "url_clave_detalle_1": "otrafuente_detail_1.html",
-# }
-# def test_otrafuente_scraper_integration(http_client, monkeypatch, app_config):
-#     """Prueba la integración del OtroFuenteScraper con HTML de fixture."""
-#     logger.info("\n--- TEST: test_otrafuente_scraper_integration ---")
-#     source_name = "otrafuente" # Asegúrate que este nombre exista en SOURCE_MAP y settings.yaml
-#     # scraper_class = OtrafuenteScraper # Asegúrate de importar la clase correcta
-#     scraper_config = app_config.get('sources', {}).get('scrapers', {}).get(source_name, {})
-#     if not scraper_config.get('base_url'): pytest.skip(f"Configuración 'base_url' no encontrada para {source_name}")
-#
-#     # scraper = scraper_class(http_client=http_client, config=scraper_config) # Crear instancia
-#     # mock_fetch = create_mock_fetch_html(OTRAFUENTE_FIXTURE_MAP)
-#     # monkeypatch.setattr(scraper, '_fetch_html', mock_fetch)
-#     # search_params = {'keywords': ['...'], 'location': '...'} # Params relevantes
-#
-#     # try:
-#     #     jobs = scraper.fetch_jobs(search_params)
-#     # except Exception as e:
-#     #      pytest.fail(f"scraper.fetch_jobs lanzó una excepción inesperada: {e}")
-#     #
-#     # # --- Asserts ---
-#     # assert isinstance(jobs, list)
-#     # assert len(jobs) > 0
-#     # assert all(isinstance(job, dict) for job in jobs)
-#     # first_job = jobs[0]
-#     # assert 'titulo' in first_job and first_job['titulo']
-#     # assert 'url' in first_job and first_job['url']
-#     # assert 'fuente' in first_job and first_job['fuente'] == source_name
-#     # # Añadir más asserts específicos para esta fuente basados en el fixture
-#     # logger.info(f"Primer trabajo parseado ({source_name}): {first_job.get('titulo')} - {first_job.get('url')}")
-#     pytest.skip(f"Prueba para {source_name} aún no implementada con fixtures.") # Saltar si no está lista
-
-
-# --- Fin de las Pruebas ---
\ No newline at end of file
+# --- Fin de las Pruebas ---
@@ -13,14 +13,9 @@ y probar el filtro de forma aislada. ¡A por ello!
 """
 
 import pytest # Nuestro framework de pruebas favorito.
-import sys
-from pathlib import Path
-
-# Añadimos la raíz del proyecto para poder importar desde src
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 # Importamos la clase que queremos probar y el módulo que vamos a "engañar" (mock/patch)
+from src.core import job_filter as job_filter_module
 from src.core.job_filter import JobFilter
 from src.utils import config_loader # Necesitamos importarlo para poder usar monkeypatch sobre él
 
@@ -48,6 +43,16 @@ SAMPLE_JOBS = [
     {'id': 11, 'titulo': 'Analista SQL', 'descripcion': '...', 'ubicacion': 'QUITO'}, # Coincidencia exacta case-insensitive
 ]
 
+# Config de filtrado que comparten las pruebas que comparan dos caminos de filtrado
+# (pandas vs bucle, por lotes, por columnas, entre hilos...). 'C++' está para que
+# algún criterio tenga metacaracteres de regex.
+FILTER_CONFIG = {
+    'job_titles': ['Data Analyst', 'Data Scientist'],
+    'tools_technologies': ['Python', 'SQL', 'C++'],
+    'topics': [],
+    'locations': ['Quito', 'Remote LATAM'],
+}
+
 # --- Fixtures de Pytest (Ayudantes para las pruebas) ---
 
 @pytest.fixture
@@ -67,6 +72,10 @@ def mock_config_filter(monkeypatch):
     # monkeypatch.setattr(config_loader, 'get_config', _mock_config) # Esto no permite pasar arg
     # Mejor, la prueba llamará a esta fixture y ella hará el patch:
 
+    # get_config() está memorizada: vaciamos su caché antes de reemplazarla para que
+    # ni esta prueba ni las siguientes (ya sin el patch) vean una config vieja.
+    config_loader.reset_config()
+
     def _patch_config(mock_data):
          monkeypatch.setattr(config_loader, 'get_config', lambda: mock_data)
 
@@ -228,4 +237,193 @@ def test_filter_combined_logic(mock_config_filter):
     assert len(filtered_results) == len(expected_ids)
     assert result_ids == expected_ids
 
+@pytest.mark.parametrize("backend", ["hyperscan", "ahocorasick", "regex"])
+def test_build_matcher_substring_semantics(monkeypatch, backend):
+    """El buscador de keywords se comporta igual con Hyperscan, pyahocorasick o la regex."""
+    backends = ["hyperscan", "ahocorasick", "regex"]
+    if backend != "regex" and getattr(job_filter_module, backend) is None:
+        pytest.skip(f"{backend} no está instalado")
+    # Desactivamos los motores con más prioridad que el que queremos probar
+    for mas_prioritario in backends[:backends.index(backend)]:
+        monkeypatch.setattr(job_filter_module, mas_prioritario, None)
+
+    find = job_filter_module._build_matcher(["power bi", "sql", "sql"])
+    assert find("analista sql senior") == "sql"
+    assert find("experto en power bi") == "power bi"
+    assert find("mysqlite") == "sql" # Coincidencia por subcadena, como antes
+    assert find("gerente de marketing") is None
+    assert find("a+b (c++)") is None # Los metacaracteres no se cuelan en la regex
+    assert job_filter_module._build_matcher(["c++"])("experto en c++") == "c++"
+    assert job_filter_module._build_matcher(["análisis"])("análisis de datos") == "análisis"
+    assert job_filter_module._build_matcher([])("lo que sea") is None
+    assert job_filter_module._build_matcher([""])("lo que sea") == ""
+
+def test_filter_thread_safe(mock_config_filter):
+    """Un mismo JobFilter usado desde varios hilos a la vez da el mismo resultado en todos."""
+    from concurrent.futures import ThreadPoolExecutor
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+    esperado = job_filter._filter_loop(SAMPLE_JOBS)
+
+    def filtrar_muchas_veces(_):
+        return [job_filter._filter_loop(SAMPLE_JOBS) for _ in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for resultados in executor.map(filtrar_muchas_veces, range(8)):
+            assert all(resultado == esperado for resultado in resultados)
+
+def test_filter_vectorized_matches_loop(mock_config_filter, monkeypatch):
+    """Solo con regex, muchas ofertas se filtran con pandas; el resultado debe ser idéntico al del bucle."""
+    if job_filter_module._load_pandas() is None:
+        pytest.skip("pandas no está instalado")
+    monkeypatch.setattr(job_filter_module, "hyperscan", None)
+    monkeypatch.setattr(job_filter_module, "ahocorasick", None)
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+    raros = [{'titulo': None, 'descripcion': None, 'ubicacion': None},
+             {'titulo': 'Dev C++', 'ubicacion': '  QUITO  '}]
+    jobs = (SAMPLE_JOBS + raros) * 10
+    assert len(jobs) >= job_filter_module.PANDAS_MIN_JOBS
+
+    usado = []
+    original = job_filter._filter_vectorized
+    monkeypatch.setattr(job_filter, "_filter_vectorized", lambda offers: usado.append(1) or original(offers))
+    accepted, _rejected = job_filter._filter_loop(jobs)
+    assert job_filter.filter_jobs(jobs) == accepted
+    assert usado, "Sin buscadores compilados, las listas grandes deberían ir por pandas"
+
+def test_filter_large_lists_skip_pandas(mock_config_filter, monkeypatch, caplog):
+    """Con Hyperscan/pyahocorasick, o con el log en DEBUG, las listas grandes no pasan por pandas."""
+    import logging
+    llamadas_pandas = []
+    def pandas_prohibido(offers):
+        # Solo lo anotamos: una excepción aquí la taparía el fallback de _filter_batch
+        llamadas_pandas.append(len(offers))
+        return []
+    jobs = SAMPLE_JOBS * 10
+    assert len(jobs) >= job_filter_module.PANDAS_MIN_JOBS
+
+    # En DEBUG (aunque solo haya regex) se usa el bucle que explica cada decisión
+    mock_config_filter(FILTER_CONFIG)
+    with monkeypatch.context() as mp:
+        mp.setattr(job_filter_module, "hyperscan", None)
+        mp.setattr(job_filter_module, "ahocorasick", None)
+        job_filter = JobFilter()
+        mp.setattr(job_filter, "_filter_vectorized", pandas_prohibido)
+        esperado = job_filter._filter_loop(jobs)
+        with caplog.at_level(logging.DEBUG, logger=job_filter_module.logger.name):
+            assert job_filter._filter_batch(jobs) == esperado
+        assert any(record.getMessage().startswith("Oferta") for record in caplog.records)
+    assert llamadas_pandas == []
+
+    # Con un buscador compilado, el bucle con ese buscador
+    if job_filter_module.hyperscan is None and job_filter_module.ahocorasick is None:
+        return # Sin ninguno de los dos no hay nada más que probar
+    job_filter = JobFilter()
+    monkeypatch.setattr(job_filter, "_filter_vectorized", pandas_prohibido)
+    assert job_filter._filter_batch(jobs) == job_filter._filter_loop(jobs)
+    assert llamadas_pandas == []
+
+def test_filter_jobs_batched(mock_config_filter):
+    """El filtrado por lotes entrega lo mismo que el filtrado normal, en el mismo orden."""
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+
+    # Un generador, como los que entregarían los scrapers, en lotes que no dividen exacto
+    resultado = list(job_filter.filter_jobs_batched((job for job in SAMPLE_JOBS), batch_size=4))
+    assert resultado == job_filter.filter_jobs(SAMPLE_JOBS)
+
+    # Sin coincidencias no hay fallback permisivo: no se entrega nada
+    mock_config_filter({'job_titles': ['Data Analyst'], 'locations': ['Madrid']})
+    assert list(JobFilter().filter_jobs_batched(SAMPLE_JOBS)) == []
+
+    with pytest.raises(ValueError):
+        next(job_filter.filter_jobs_batched(SAMPLE_JOBS, batch_size=0))
+
+def test_filter_loop_fast_matches_verbose(mock_config_filter):
+    """El bucle rápido (sin DEBUG) acepta y rechaza exactamente lo mismo que el detallado."""
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+    jobs = SAMPLE_JOBS + [{'titulo': None, 'descripcion': None, 'ubicacion': None},
+                          {'titulo': 'Dev Python', 'ubicacion': '  '}]
+    assert job_filter._filter_loop(jobs) == job_filter._filter_loop_verbose(jobs)
+
+def test_filter_jobs_soa(mock_config_filter):
+    """El filtro por columnas marca exactamente las ofertas que acepta el filtro normal."""
+    if job_filter_module.np is None:
+        pytest.skip("numpy no está instalado")
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+
+    mask = job_filter.filter_jobs_soa(
+        [job.get('titulo', "") for job in SAMPLE_JOBS],
+        [job.get('descripcion', "") for job in SAMPLE_JOBS],
+        [job.get('ubicacion', "") for job in SAMPLE_JOBS],
+    )
+    esperados = {job['id'] for job in job_filter._filter_loop(SAMPLE_JOBS)[0]}
+    assert {job['id'] for job, ok in zip(SAMPLE_JOBS, mask) if ok} == esperados
+
+    with pytest.raises(ValueError):
+        job_filter.filter_jobs_soa(["a"], ["b"], [])
+
+@pytest.mark.parametrize("backend", ["msgspec", "orjson", "json"])
+def test_decode_jobs_same_result_on_every_backend(monkeypatch, backend):
+    """decode_jobs devuelve los mismos dicts (con todos sus campos) con msgspec, orjson o json."""
+    import json
+    if backend == "msgspec" and job_filter_module._jobs_decoder is None:
+        pytest.skip("msgspec no está instalado")
+    if backend == "orjson" and job_filter_module.orjson is None:
+        pytest.skip("orjson no está instalado")
+    if backend != "msgspec":
+        monkeypatch.setattr(job_filter_module, "_jobs_decoder", None)
+    if backend == "json":
+        monkeypatch.setattr(job_filter_module, "orjson", None)
+
+    jobs = SAMPLE_JOBS + [{'id': 'abc-1', 'titulo': 'Data Analyst', 'ubicacion': 'Quito',
+                           'fecha_publicacion': '2024-05-01', 'salario': {'min': 1000, 'max': 1500}}]
+    decoded = job_filter_module.decode_jobs(json.dumps(jobs).encode("utf-8"))
+    assert decoded == jobs
+    assert all(type(job) is dict for job in decoded)
+
+def test_filter_decoded_jobs(mock_config_filter):
+    """Las ofertas decodificadas con decode_jobs se filtran igual que los dicts originales."""
+    import json
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+
+    decoded = job_filter_module.decode_jobs(json.dumps(SAMPLE_JOBS).encode("utf-8"))
+    assert job_filter.filter_jobs(decoded) == job_filter.filter_jobs(SAMPLE_JOBS)
+
+def test_filter_uses_normalized_jobs(mock_config_filter):
+    """normalize_for_filter deja el texto preparado y filter_jobs lo aprovecha sin cambiar el resultado."""
+    import copy
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+    jobs = copy.deepcopy(SAMPLE_JOBS)
+    esperados = [job['id'] for job in job_filter.filter_jobs(jobs)]
+
+    for job in jobs:
+        job_filter_module.normalize_for_filter(job)
+    assert jobs[0]['_h'] == 'data analyst con python análisis de datos y sql '
+    assert jobs[0]['_loc'] == 'quito'
+    assert [job['id'] for job in job_filter.filter_jobs(jobs)] == esperados
+
+    # Si se cambia la oferta y se vuelve a normalizar, el texto cacheado se actualiza
+    jobs[0]['ubicacion'] = 'Lima'
+    assert job_filter_module.normalize_for_filter(jobs[0])['_loc'] == 'lima'
+
+def test_filter_jobs_parallel(mock_config_filter, monkeypatch):
+    """Repartido entre procesos, el filtrado devuelve las mismas ofertas (los mismos dicts)."""
+    mock_config_filter(FILTER_CONFIG)
+    job_filter = JobFilter()
+    jobs = [dict(job, id=i) for i, job in enumerate(SAMPLE_JOBS * 5)]
+    esperado = job_filter.filter_jobs(jobs)
+
+    # Con pocas ofertas no se arrancan procesos
+    assert job_filter.filter_jobs_parallel(jobs, workers=2) == esperado
+
+    monkeypatch.setattr(job_filter_module, "PARALLEL_MIN_JOBS", 0)
+    resultado = job_filter.filter_jobs_parallel(jobs, workers=2)
+    assert [id(job) for job in resultado] == [id(job) for job in esperado]
+
 # --- Fin de las Pruebas ---
\ No newline at end of file
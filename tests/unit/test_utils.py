@@ -12,20 +12,23 @@ hacen exactamente lo que deben en diferentes escenarios.
 
 import pytest   # Framework de pruebas
 import logging  # Para verificar logs con caplog
-import os       # Para interactuar con variables de entorno (aunque monkeypatch lo facilita)
-import sys
-from pathlib import Path
-
-# Añadimos la raíz del proyecto para poder importar desde src
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import os
+import threading
 
 # Importamos las funciones/clases que vamos a probar
 from src.utils import helpers
+from src.utils import config_loader
 from src.utils.config_loader import get_secret
 
 # --- Pruebas para helpers.py ---
 
+@pytest.fixture(autouse=True)
+def _clear_normalize_cache():
+    """Vacía la caché de normalize_text para que cada prueba parta de cero."""
+    helpers._normalize_text_cached.cache_clear()
+    yield
+    helpers._normalize_text_cached.cache_clear()
+
 # Usamos parametrize para probar muchos casos de normalize_text fácilmente
 @pytest.mark.parametrize(
     "input_text, remove_accents, lowercase, expected_output",
@@ -62,6 +65,54 @@ def test_normalize_text(input_text, remove_accents, lowercase, expected_output):
     print(f"\nTEST: normalize_text('{input_text}', remove_accents={remove_accents}, lowercase={lowercase}) -> Esperado: '{expected_output}'")
     assert helpers.normalize_text(input_text, remove_accents=remove_accents, lowercase=lowercase) == expected_output
 
+@pytest.mark.parametrize("lowercase", [True, False])
+def test_normalize_text_long_ascii(lowercase):
+    """Los textos ASCII largos (atajo con Numba, si está) dan lo mismo que el camino normal."""
+    texto = "  Senior DATA Engineer\t\n -  Remote\x0b\x1f(LATAM)   " * 20
+    assert len(texto) >= helpers._NUMBA_MIN_LEN
+    esperado = helpers.normalize_text(texto + "é", lowercase=lowercase)[:-2] # Con 'é' no hay atajo
+    assert helpers.normalize_text(texto, lowercase=lowercase) == esperado
+
+def test_helpers_import_does_not_load_numba():
+    """Importar helpers no carga numba: eso queda para el primer texto ASCII largo."""
+    import subprocess
+    import sys
+    from pathlib import Path
+    codigo = "import sys; import src.utils.helpers; print('numba' in sys.modules)"
+    raiz = Path(__file__).resolve().parents[2]
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz,
+                            capture_output=True, text=True, check=True)
+    assert salida.stdout.strip() == "False"
+
+def test_normalize_text_numba_compile_failure_uses_regex(monkeypatch, caplog):
+    """Si Numba no consigue compilar el atajo, se avisa una vez y se sigue con la regex."""
+    numba = pytest.importorskip("numba")
+    def njit_roto(*args, **kwargs):
+        def decorar(func):
+            def falla(*a, **k):
+                raise RuntimeError("fallo de compilación simulado")
+            return falla
+        return decorar
+    monkeypatch.setattr(numba, "njit", njit_roto)
+    helpers._get_normalize_ascii.cache_clear()
+    helpers._normalize_text_cached.cache_clear()
+    try:
+        with caplog.at_level(logging.WARNING, logger=helpers.__name__):
+            texto = "  Senior DATA   Engineer  " * 20
+            assert helpers._get_normalize_ascii() is None
+            assert helpers.normalize_text(texto) == " ".join(texto.lower().split())
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
+    finally:
+        helpers._get_normalize_ascii.cache_clear()
+        helpers._normalize_text_cached.cache_clear()
+
+@pytest.mark.parametrize("texto", ["Ærø Łódź Šťastný", "ﬁnanzas Ω 中文 a\u0301"], ids=["latin_extendido", "fuera_de_tabla"])
+def test_normalize_text_accent_table_matches_nfkd(texto):
+    """La tabla de acentos da lo mismo que el NFKD + ASCII de siempre."""
+    import unicodedata
+    esperado = unicodedata.normalize('NFKD', texto.lower()).encode('ascii', 'ignore').decode('ascii')
+    assert helpers.normalize_text(texto) == esperado
+
 # Pruebas para safe_url_join
 @pytest.mark.parametrize(
     "base, relative, expected_output",
@@ -83,12 +134,14 @@ def test_normalize_text(input_text, remove_accents, lowercase, expected_output):
         ("ftp://ftp.ejemplo.com", "archivo.zip", "ftp://ftp.ejemplo.com/archivo.zip"),
         # Base inválida (urljoin puede ser permisivo, pero nuestra validación extra debería devolver None)
         ("esto no es url", "path", None),
+        # Base inválida pero la ruta ya es absoluta: urljoin devuelve la ruta tal cual
+        ("esto no es url", "https://www.ejemplo.com/oferta", "https://www.ejemplo.com/oferta"),
     ],
     ids=[
         "relativo_simple", "absoluto_desde_raiz", "subir_nivel", "relativo_a_pagina",
         "path_ya_absoluto", "base_sin_slash", "base_y_path_con_slash",
         "base_none", "relativa_none", "base_vacia", "relativa_vacia",
-        "otro_esquema", "base_invalida"
+        "otro_esquema", "base_invalida", "base_invalida_ruta_absoluta"
     ]
 )
 def test_safe_url_join(base, relative, expected_output):
@@ -99,6 +152,13 @@ def test_safe_url_join(base, relative, expected_output):
 
 # --- Pruebas para config_loader.get_secret ---
 
+@pytest.fixture(autouse=True)
+def _clear_secret_cache():
+    """Vacía la caché de get_secret para que ningún test vea secretos de otro."""
+    config_loader.reset_secrets()
+    yield
+    config_loader.reset_secrets()
+
 # Usamos monkeypatch para simular variables de entorno sin afectar el sistema real.
 def test_get_secret_exists(monkeypatch):
     """Prueba obtener un secreto que sí existe en las variables de entorno."""
@@ -121,7 +181,12 @@ def test_get_secret_not_exists(monkeypatch, caplog):
     # Verificamos que devuelve None
     assert get_secret(secret_key) is None
     # Verificamos que se registró una advertencia en el log usando caplog
-    assert f"Variable de entorno/secreto '{secret_key}' no encontrada" in caplog.text
+    # (mirando los registros uno a uno, sin renderizar todo el log como texto)
+    assert any(
+        record.levelno == logging.WARNING
+        and f"Variable de entorno/secreto '{secret_key}' no encontrada" in record.getMessage()
+        for record in caplog.records
+    )
 
 def test_get_secret_not_exists_with_default(monkeypatch):
     """Prueba obtener un secreto que NO existe, pero con un valor default."""
@@ -146,6 +211,268 @@ def test_get_secret_placeholder_warning(monkeypatch, caplog):
     # Verificamos que devuelve el placeholder (la función actual no lo bloquea)
     assert get_secret(secret_key) == placeholder_value
     # Verificamos que se registró el mensaje de ERROR sobre el placeholder
-    assert f"¡ALERTA! El valor para '{secret_key}' ('{placeholder_value}') parece un placeholder" in caplog.text
+    assert any(
+        record.levelno == logging.ERROR
+        and f"¡ALERTA! El valor para '{secret_key}' ('{placeholder_value}') parece un placeholder" in record.getMessage()
+        for record in caplog.records
+    )
+
+def test_get_secret_memoizes_until_reset(monkeypatch):
+    """Los secretos encontrados se recuerdan hasta reset_secrets(); los que faltan no."""
+    secret_key = "MI_TEST_SECRET_MEMO"
+    monkeypatch.delenv(secret_key, raising=False)
+    assert get_secret(secret_key, default="x") == "x"
+
+    # Una clave que no existía aparece en cuanto se define
+    monkeypatch.setenv(secret_key, "primero")
+    assert get_secret(secret_key) == "primero"
+
+    # Ya leída, se queda en caché aunque cambie el entorno...
+    monkeypatch.setenv(secret_key, "segundo")
+    assert get_secret(secret_key) == "primero"
+
+    # ...hasta que se vacía explícitamente
+    config_loader.reset_secrets()
+    assert get_secret(secret_key) == "segundo"
+
+# --- Pruebas para config_loader.load_config ---
+
+@pytest.fixture
+def temp_config_files(tmp_path, monkeypatch):
+    """
+    Apunta config_loader a un settings.yaml y un .env temporales, partiendo
+    de una caché vacía. Devuelve el directorio donde están los archivos.
+    """
+    (tmp_path / "settings.yaml").write_text(
+        "job_titles:\n  - Data Analyst\nlocations:\n  - Quito\n", encoding="utf-8")
+    (tmp_path / ".env").write_text("MI_TEST_SECRET_DESDE_ENV=desde_env\n", encoding="utf-8")
+    monkeypatch.setattr(config_loader, "SETTINGS_FILE", tmp_path / "settings.yaml")
+    monkeypatch.setattr(config_loader, "ENV_FILE", tmp_path / ".env")
+    monkeypatch.delenv("MI_TEST_SECRET_DESDE_ENV", raising=False)
+    config_loader.reset_for_tests()
+    yield tmp_path
+    config_loader.reset_for_tests() # Que la próxima prueba vuelva a leer la config real
+
+def test_load_config_concurrent_first_use(temp_config_files, monkeypatch):
+    """Varios hilos pidiendo la config a la vez: se carga una sola vez y todos reciben la misma."""
+    llamadas_dotenv = []
+    original_load_env_file = config_loader._load_env_file
+    def contar_load_env_file(*args, **kwargs):
+        llamadas_dotenv.append(args)
+        return original_load_env_file(*args, **kwargs)
+    monkeypatch.setattr(config_loader, "_load_env_file", contar_load_env_file)
+
+    barrera = threading.Barrier(8)
+    resultados = []
+    def trabajador():
+        barrera.wait() # Que todos arranquen a la vez
+        resultados.append(config_loader.load_config())
+    hilos = [threading.Thread(target=trabajador) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert len(resultados) == 8
+    assert all(config is resultados[0] for config in resultados)
+    assert resultados[0]["job_titles"] == ("Data Analyst",)
+    assert len(llamadas_dotenv) == 1
+    assert get_secret("MI_TEST_SECRET_DESDE_ENV") == "desde_env"
+
+def test_load_env_file_matches_dotenv(tmp_path, monkeypatch):
+    """Nuestro lector de .env deja las mismas variables que python-dotenv."""
+    from dotenv import dotenv_values
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# Comentario\n"
+        "\n"
+        "MI_ENV_PLANO=valor\n"
+        "  MI_ENV_ESPACIOS = con espacios  \n"
+        "MI_ENV_DOBLES=\"entre comillas\"\n"
+        "MI_ENV_SIMPLES='# no es comentario'\n"
+        "MI_ENV_COMENTARIO=valor # nota\n"
+        "MI_ENV_COMENTARIO_TAB=valor\t# nota\n"
+        "MI_ENV_ALMOHADILLA=a#b\n"
+        "export MI_ENV_EXPORT=exportado\n"
+        "MI_ENV_VACIO=\n"
+        "MI_ENV_URL=https://ejemplo.com/?a=1&b=2\n",
+        encoding="utf-8")
+    esperado = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    for key in esperado:
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setattr(config_loader, "load_dotenv", None) # No debe hacer falta dotenv
+
+    assert config_loader._load_env_file(env_file) is True
+    assert {k: os.environ[k] for k in esperado} == esperado
+
+def test_load_env_file_falls_back_to_dotenv(tmp_path, monkeypatch):
+    """Con expansión ${VAR} le dejamos el archivo a python-dotenv."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("MI_ENV_BASE=raiz\nMI_ENV_EXPANDIDA=${MI_ENV_BASE}/sub\n", encoding="utf-8")
+    monkeypatch.delenv("MI_ENV_BASE", raising=False)
+    monkeypatch.delenv("MI_ENV_EXPANDIDA", raising=False)
+
+    assert config_loader._load_env_file(env_file) is True
+    assert os.environ["MI_ENV_EXPANDIDA"] == "raiz/sub"
+
+def test_load_config_uses_disk_cache(temp_config_files, monkeypatch):
+    """La segunda carga sale de la caché sin parsear YAML; si el YAML cambia, se reparsea."""
+    monkeypatch.delenv(config_loader.CACHE_DISABLE_ENV, raising=False)
+    primera = config_loader.load_config()
+    assert config_loader._settings_cache_path().is_file()
+    assert not list(temp_config_files.glob("*.pkl")) # Nada de cachés junto a settings.yaml
+
+    config_loader.reset_config()
+    def yaml_prohibido(*args, **kwargs):
+        raise AssertionError("No debería parsearse el YAML si la caché está al día")
+    with monkeypatch.context() as mp:
+        mp.setattr(config_loader.yaml, "load", yaml_prohibido)
+        assert config_loader.load_config() == primera
+
+    # Cambiamos settings.yaml con el mismo tamaño y la misma fecha: la huella
+    # es del contenido, así que la caché ya no vale
+    settings = temp_config_files / "settings.yaml"
+    st = settings.stat()
+    settings.write_text(settings.read_text(encoding="utf-8").replace("Analyst", "Analist"), encoding="utf-8")
+    os.utime(settings, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert settings.stat().st_size == st.st_size
+    config_loader.reset_config()
+    assert config_loader.load_config()["job_titles"] == ("Data Analist",)
+
+@pytest.mark.skipif(os.name != "posix", reason="Los permisos de grupo/otros solo se revisan en POSIX")
+def test_load_config_ignores_untrusted_cache(temp_config_files, monkeypatch):
+    """Una caché que otros usuarios pueden modificar no se carga (sería ejecutar su pickle)."""
+    monkeypatch.delenv(config_loader.CACHE_DISABLE_ENV, raising=False)
+    primera = config_loader.load_config()
+    cache_path = config_loader._settings_cache_path()
+    assert cache_path.stat().st_mode & 0o077 == 0 # Solo el dueño la puede leer/escribir
+    cache_path.chmod(0o666)
+
+    config_loader.reset_config()
+    parseos = []
+    original_load = config_loader.yaml.load
+    def contar_load(*args, **kwargs):
+        parseos.append(1)
+        return original_load(*args, **kwargs)
+    monkeypatch.setattr(config_loader.yaml, "load", contar_load)
+    assert config_loader.load_config() == primera
+    assert parseos == [1]
+
+def test_load_config_cache_can_be_disabled(temp_config_files, monkeypatch):
+    """Con CONFIG_CACHE_DISABLE=1 no se escribe (ni se lee) la caché."""
+    monkeypatch.setenv(config_loader.CACHE_DISABLE_ENV, "1")
+    assert config_loader.load_config()["locations"] == ("Quito",)
+    assert not config_loader._settings_cache_path().exists()
+
+def test_load_config_is_read_only(temp_config_files):
+    """La config se entrega congelada: se puede leer y compartir, pero no modificar."""
+    (temp_config_files / "settings.yaml").write_text(
+        "logging:\n  level: INFO\nlocations:\n  - Quito\n  - {ciudad: Guayaquil}\n", encoding="utf-8")
+    config = config_loader.load_config()
+    assert config.get("logging", {}).get("level") == "INFO"
+    with pytest.raises(TypeError):
+        config["logging"]["level"] = "DEBUG"
+    with pytest.raises(TypeError):
+        config["nueva"] = 1
+    assert isinstance(config["locations"], tuple)
+    with pytest.raises(TypeError):
+        config["locations"][1]["ciudad"] = "Cuenca"
+
+def test_regular_file(tmp_path):
+    """_regular_file se comporta como Path.is_file() para archivos, carpetas y rutas que no existen."""
+    archivo = tmp_path / "settings.yaml"
+    archivo.write_text("a: 1\n", encoding="utf-8")
+    for ruta in (archivo, tmp_path, tmp_path / "no_existe.yaml", archivo / "debajo_de_un_archivo"):
+        assert config_loader._regular_file(ruta) == ruta.is_file()
+
+@pytest.mark.parametrize("ruta, esperado", [
+    ("logging.level", "INFO"),
+    ("data_storage.sqlite.database_name", "jobs.db"),
+    ("data_storage.sqlite", {"database_name": "jobs.db"}),
+    ("data_storage.csv.export_enabled", "falta"),   # Sección que no existe
+    ("logging.level.otra", "falta"),                # Se topa con un escalar
+    ("no_existe", "falta"),
+])
+def test_dig(ruta, esperado):
+    """_dig baja por la config con una ruta 'a.b.c' y devuelve el default si algo falta."""
+    config = config_loader._freeze({
+        "logging": {"level": "INFO"},
+        "data_storage": {"sqlite": {"database_name": "jobs.db"}},
+    })
+    assert config_loader._dig(config, ruta, "falta") == esperado
+
+def test_get_settings_attribute_access(temp_config_files):
+    """get_settings() da la misma config con acceso por atributos, y se rehace tras reset_config()."""
+    (temp_config_files / "settings.yaml").write_text(
+        "sources:\n  apis:\n    adzuna: {enabled: true}\nlocations:\n  - Quito\n  - {ciudad: Guayaquil}\n",
+        encoding="utf-8")
+    settings = config_loader.get_settings()
+    assert settings.sources.apis.adzuna.enabled is True
+    assert settings.locations[0] == "Quito"
+    assert settings.locations[1].ciudad == "Guayaquil"
+    assert getattr(settings, "no_existe", None) is None
+    assert config_loader.get_settings() is settings
+
+    (temp_config_files / "settings.yaml").write_text("locations:\n  - Cuenca\n", encoding="utf-8")
+    config_loader.reset_config()
+    assert config_loader.get_settings().locations == ("Cuenca",)
+
+def test_reset_config_keeps_dotenv_loaded(temp_config_files, monkeypatch):
+    """reset_config() recarga settings.yaml pero el .env se lee una sola vez."""
+    llamadas = []
+    original_load_env_file = config_loader._load_env_file
+    def contar_load_env_file(*args, **kwargs):
+        llamadas.append(args)
+        return original_load_env_file(*args, **kwargs)
+    monkeypatch.setattr(config_loader, "_load_env_file", contar_load_env_file)
+
+    config_loader.load_config()
+    config_loader.reset_config()
+    config_loader.load_config()
+    assert len(llamadas) == 1
+
+    config_loader.reset_for_tests()
+    config_loader.load_config()
+    assert len(llamadas) == 2
+
+def test_load_config_scans_placeholders_once(temp_config_files, monkeypatch, caplog):
+    """Los placeholders del .env se detectan al cargarlo; get_secret solo consulta el resultado."""
+    (temp_config_files / ".env").write_text("MI_TEST_SECRET_PLACEHOLDER_ENV=YOUR_KEY_HERE\n", encoding="utf-8")
+    monkeypatch.delenv("MI_TEST_SECRET_PLACEHOLDER_ENV", raising=False)
+    caplog.set_level(logging.ERROR)
+
+    config_loader.load_config()
+    assert "MI_TEST_SECRET_PLACEHOLDER_ENV" in config_loader._placeholder_keys
+    assert any("MI_TEST_SECRET_PLACEHOLDER_ENV" in record.getMessage() for record in caplog.records)
+
+    caplog.clear()
+    assert get_secret("MI_TEST_SECRET_PLACEHOLDER_ENV") == "YOUR_KEY_HERE"
+    assert any(record.levelno == logging.ERROR for record in caplog.records)
+
+def test_get_config_section_without_full_load(temp_config_files, monkeypatch):
+    """get_config_section construye solo la sección pedida, sin cargar toda la config."""
+    monkeypatch.setenv(config_loader.CACHE_DISABLE_ENV, "1")
+    (temp_config_files / "settings.yaml").write_text(
+        "base: &base\n  log_file: app.log\n"
+        "logging:\n  <<: *base\n  level: DEBUG\n"
+        "locations:\n  - Quito\n", encoding="utf-8")
+
+    assert config_loader.get_config_section("logging") == {"log_file": "app.log", "level": "DEBUG"}
+    assert config_loader.get_config_section("no_existe", default="x") == "x"
+    assert config_loader._config is None # No se cargó la config completa
+
+    # Una vez cargada la config completa, las secciones salen de ella
+    config_loader.load_config()
+    assert config_loader.get_config_section("locations") == ("Quito",)
+
+@pytest.mark.parametrize("contenido, esperado", [
+    ("", {}), # Archivo vacío: mmap no se puede usar, pero la config queda vacía igual
+    ("\ufeffciudad: Bogotá\n", {"ciudad": "Bogotá"}), # UTF-8 con BOM y acentos
+], ids=["vacio", "utf8_bom"])
+def test_load_config_reads_raw_bytes(temp_config_files, monkeypatch, contenido, esperado):
+    """settings.yaml se lee como bytes (mmap): la codificación la resuelve el parser YAML."""
+    monkeypatch.setenv(config_loader.CACHE_DISABLE_ENV, "1")
+    (temp_config_files / "settings.yaml").write_bytes(contenido.encode("utf-8"))
+    assert config_loader.load_config() == esperado
 
 # --- Fin de las Pruebas ---
\ No newline at end of file